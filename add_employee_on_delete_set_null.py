@@ -0,0 +1,34 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Switching the employee foreign keys to ON DELETE SET NULL...")
+
+    # When an employee is deleted, PostgreSQL sets products.product_manager_id and message_logs.employee_id to NULL.
+    # create_tables.py doesn't change existing tables, so the constraints (and the index that the
+    # product lookup uses) are replaced here once
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE products DROP CONSTRAINT IF EXISTS products_product_manager_id_fkey"))
+        connection.execute(text(
+            "ALTER TABLE products ADD CONSTRAINT products_product_manager_id_fkey "
+            "FOREIGN KEY (product_manager_id) REFERENCES employees (id) ON DELETE SET NULL"
+        ))
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_products_product_manager_id ON products (product_manager_id)"))
+
+        connection.execute(text("ALTER TABLE message_logs DROP CONSTRAINT IF EXISTS message_logs_employee_id_fkey"))
+        connection.execute(text(
+            "ALTER TABLE message_logs ADD CONSTRAINT message_logs_employee_id_fkey "
+            "FOREIGN KEY (employee_id) REFERENCES employees (id) ON DELETE SET NULL"
+        ))
+
+    print("Foreign keys switched successfully!")
@@ -0,0 +1,32 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+# (index name, table) of the (created_at, id) indexes behind the keyset pagination of the list endpoints
+KEYSET_INDEXES = [
+    ("ix_employees_created_at_id", "employees"),
+    ("ix_products_created_at_id", "products"),
+]
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Adding the keyset pagination indexes...")
+
+    # create_tables.py only creates missing tables, so the indexes are added to the existing tables here.
+    # The pages are read newest first, (created_at DESC, id DESC) is a backward scan of these indexes.
+    # CONCURRENTLY doesn't lock the tables for writes, but can't run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for index_name, table_name in KEYSET_INDEXES:
+            connection.execute(text(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name} (created_at, id)"
+            ))
+
+    print("Indexes added successfully!")
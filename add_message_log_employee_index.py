@@ -0,0 +1,25 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Adding the (employee_id, timestamp) index to message_logs...")
+
+    # create_tables.py only creates missing tables, so the index is added to an existing message_logs table here.
+    # CONCURRENTLY doesn't lock the table for writes, but can't run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_logs_employee_id_timestamp "
+            "ON message_logs (employee_id, timestamp DESC)"
+        ))
+
+    print("Index added successfully!")
@@ -0,0 +1,28 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Adding database side defaults to ids and timestamps...")
+
+    # The ids of employees and products (gen_random_uuid(), built in since PostgreSQL 13) and all timestamps (now())
+    # are generated by PostgreSQL. create_tables.py doesn't change existing tables, so the column defaults are added here once
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE employees ALTER COLUMN id SET DEFAULT gen_random_uuid()"))
+        connection.execute(text("ALTER TABLE products ALTER COLUMN id SET DEFAULT gen_random_uuid()"))
+
+        for table in ("employees", "products"):
+            connection.execute(text(f"ALTER TABLE {table} ALTER COLUMN created_at SET DEFAULT now()"))
+            connection.execute(text(f"ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT now()"))
+        connection.execute(text("ALTER TABLE message_logs ALTER COLUMN timestamp SET DEFAULT now()"))
+
+    print("Database side defaults added successfully!")
@@ -0,0 +1,38 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+# (index name, table, column) of the trigram indexes for the name searches of the API
+# and the partial text filters of the Telegram bot queries
+TRIGRAM_INDEXES = [
+    ("ix_employees_name_trgm", "employees", "name"),
+    ("ix_employees_email_trgm", "employees", "email"),
+    ("ix_employees_phone_number_trgm", "employees", "phone_number"),
+    ("ix_products_name_trgm", "products", "name"),
+    ("ix_products_description_trgm", "products", "description"),
+]
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Adding the trigram search indexes...")
+
+    # create_tables.py only creates missing tables, so the indexes are added to the existing tables here.
+    # CONCURRENTLY doesn't lock the tables for writes, but can't run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+        for index_name, table_name, column_name in TRIGRAM_INDEXES:
+            connection.execute(text(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON {table_name} USING gin ({column_name} gin_trgm_ops)"
+            ))
+
+    print("Indexes added successfully!")
@@ -2,25 +2,86 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
-# Import of SQLAlchemy Session (for type hints)
-from sqlalchemy.orm import Session
-
-# Import of database dependency
-from database.database import get_db
-
 # Import of EmployeeService
 from services.employee_service import EmployeeService, get_employee_service
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
-from uuid import UUID
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional
+
+from cachetools import TTLCache
 
 # Import of JWT decoding method
-from utils.jwt_utils import decode_access_token
+from utils.jwt_utils import decode_access_token, get_employee_id_from_token
+
 
+logger = logging.getLogger(__name__)
 
 templates = Jinja2Templates(directory="templates")
 
+# The magic link pages don't change at runtime: no stat() of the template files on every request,
+# and the compiled templates are cached on disk, so new workers skip the parsing
+templates.env.auto_reload = False
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+# Pages rendered by verify_magic_link
+MAGIC_LINK_TEMPLATES = ("magic_link_success.html", "magic_link_failure.html")
+
+
+def load_magic_link_templates():
+    """
+    Compiles the magic link pages once, so the first verification request doesn't have to.
+    """
+
+    for template_name in MAGIC_LINK_TEMPLATES:
+        templates.get_template(template_name)
+
+# Short-lived cache of decoded magic link tokens.
+# Keyed by a SHA-256 hash of the token, so the raw token itself is never stored.
+_token_cache = TTLCache(maxsize=4096, ttl=60)
+# verify_magic_link runs in the threadpool, TTLCache itself is not thread-safe
+_token_cache_lock = threading.Lock()
+
+
+def decode_magic_link_token(token: str) -> Optional[dict]:
+    """
+    Decodes a magic link token, reusing the payload of recently decoded tokens.
+    Repeated clicks on the same link (retries, mail client prefetching)
+    don't have to parse and verify the JWT again.
+
+    Args:
+        token (str): The JWT string from the magic link.
+
+    Returns:
+        Optional[dict]: The decoded payload if the token is valid and not expired, otherwise None.
+    """
+
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+
+    if payload is None:
+        payload = decode_access_token(token)
+        # Magic links have to expire, tokens without 'exp' are rejected (and never cached)
+        if payload is None or "exp" not in payload:
+            return None
+        with _token_cache_lock:
+            _token_cache[key] = payload
+
+    # A cached payload can outlive the token itself, so the expiry is checked on every hit
+    elif payload["exp"] < time.time():
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+
+    return payload
+
 
 auth_router = APIRouter(
     prefix="/auth",
@@ -29,63 +90,53 @@ auth_router = APIRouter(
 )
 
 @auth_router.get("/verify", response_class=HTMLResponse)
-async def verify_magic_link(request: Request, token: str, db: Session = Depends(get_db)):
+def verify_magic_link(request: Request, token: str, employee_service: EmployeeService = Depends(get_employee_service)):
     """
     temporary endpoint to test success and failure pages
     """
 
-    # Decoding and validating token
-    decoded_token = decode_access_token(token)
-    employee_service = EmployeeService(db)
+    # Decoding and validating token, the session only checks out a connection on its first query,
+    # so invalid or expired links never touch the database
+    decoded_token = decode_magic_link_token(token)
+
+    if decoded_token is None:
+        logger.info("Magic link token could not be decoded (invalid/expired/malformed).")
+
+        # return failure HTML page
+        return templates.TemplateResponse("magic_link_failure.html", {"request": request})
 
     try:
         # Extract employee_id and email address from decoded token
-        employee_id = UUID(decoded_token.get("employee_id"))
+        employee_id = get_employee_id_from_token(decoded_token)
         employee_email_from_token = decoded_token.get("email")
 
-        # Find employee in database by ID
-        employee = employee_service.get_employee_by_id(employee_id)
+        # Sets 'is_authenticated = True' in one statement, but only if
+        # the employee exists, the token email address matches the database email address
+        # and the employee is not authenticated yet
+        authenticated = employee_service.authenticate_if_pending(employee_id, employee_email_from_token)
 
-        # Extra checks:
-        # does the employee exist?
-        # Does the token email address match the database email address?
+        if authenticated:
+            logger.info("Employee %s (%s) successfully authenticated.", employee_id, employee_email_from_token)
 
-        if employee and str(employee.email).lower() == employee_email_from_token.lower():
-            # If the above checks pass: check that the employee is not already authenticated
-            # then setting 'is_authenticated = True'
+            # return success HTML page
+            return templates.TemplateResponse("magic_link_success.html", {"request": request})
 
-            if not employee.is_authenticated:
-                updated_employee = employee_service.set_employee_authenticated_status(employee_id, True)
-                if updated_employee:
-                    print(
-                        f"Employee {employee_id} ({employee_email_from_token}) successfully authenticated.")
+        elif authenticated is False:
+            logger.info("Employee %s is already authenticated. No update necessary.", employee_id)
 
-                    # return success HTML page
-                    return templates.TemplateResponse("magic_link_success.html", {"request": request})
-
-                else:
-                    print(f"ERROR: is_authenticated status for Employee {employee_id} cannot be updated.")
-            else:
-                print(f"Employee {employee_id} is already authenticated. No update necessary.")
-
-                # return success HTML page again
-                return templates.TemplateResponse("magic_link_success.html", {"request": request})
+            # return success HTML page again
+            return templates.TemplateResponse("magic_link_success.html", {"request": request})
 
         else:
-            print(f"Token-Payload does not match MEmployee data or Employee was not found.")
-            print(f"Employee ID from token: {employee_id}, Email from token: {employee_email_from_token}")
-            print(
-                f"Employee from DB: {employee.id if employee else 'None'}, Email from DB: {employee.email if employee else 'None'}")
+            logger.info("Token-Payload does not match Employee data or Employee was not found. "
+                        "Employee ID from token: %s, Email from token: %s", employee_id, employee_email_from_token)
 
     except ValueError as e:
         # Error if the UUID in the JWT is invalid
-        print(f"ERROR: Invalid UUID in token payload: {e}")
+        logger.error("Invalid UUID in token payload: %s", e)
 
     except Exception as e:
-        print(f"ERROR: Unexpected error while token verification: {e}")
-
-    else:
-        print("Magic link token could not be decoded (invalid/expired/malformed).")
+        logger.error("Unexpected error while token verification: %s", e)
 
     # return failure HTML page
     return templates.TemplateResponse("magic_link_failure.html", {"request": request})
@@ -1,28 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
+import hmac
 import os
+import threading
+import time
+
+from cachetools import TTLCache
 
 
 DOCS_USERNAME = os.getenv("DOCS_USERNAME", "admin")
 DOCS_PASSWORD = os.getenv("DOCS_PASSWORD", "supersecret")
 
+# Pre-encoded credentials, so the comparison does not re-encode them on every request
+DOCS_USERNAME_B = DOCS_USERNAME.encode("utf-8")
+DOCS_PASSWORD_B = DOCS_PASSWORD.encode("utf-8")
+
+# Failed login attempts per client IP in fixed windows: after DOCS_MAX_FAILED_LOGINS wrong attempts
+# further wrong attempts of the IP get 429 until its window of DOCS_LOGIN_WINDOW_SECONDS is over
+DOCS_MAX_FAILED_LOGINS = int(os.getenv("DOCS_MAX_FAILED_LOGINS", "5"))
+DOCS_LOGIN_WINDOW_SECONDS = int(os.getenv("DOCS_LOGIN_WINDOW_SECONDS", "60"))
+
+# Client IP -> (start of its window, failed attempts in it)
+_failed_logins = TTLCache(maxsize=10000, ttl=DOCS_LOGIN_WINDOW_SECONDS)
+_failed_logins_lock = threading.Lock()
+
+# Fly.io sets FLY_APP_NAME on its machines. Only there every request comes through the Fly proxy,
+# anywhere else the Fly-Client-IP header is set by the client itself and can't be trusted
+BEHIND_FLY_PROXY = bool(os.getenv("FLY_APP_NAME"))
+
 # Initialize the HTTP basic security scheme
 security = HTTPBasic()
 
 
+def get_client_ip(request: Request) -> str:
+    """
+    Returns the IP address of the client. On Fly.io every request comes from the Fly proxy,
+    which passes the address of the actual client in the Fly-Client-IP header.
+    """
+
+    if BEHIND_FLY_PROXY:
+        fly_client_ip = request.headers.get("fly-client-ip")
+        if fly_client_ip:
+            return fly_client_ip
+    return request.client.host if request.client else "unknown"
+
+
+def _count_failed_login(client_ip: str) -> int:
+    """
+    Counts a failed login of the client IP and returns its number of failed attempts in the current window.
+    """
+
+    now = time.monotonic()
+    with _failed_logins_lock:
+        window_start, failed_attempts = _failed_logins.get(client_ip, (now, 0))
+        if now - window_start >= DOCS_LOGIN_WINDOW_SECONDS:
+            window_start, failed_attempts = now, 0
+        failed_attempts += 1
+        _failed_logins[client_ip] = (window_start, failed_attempts)
+    return failed_attempts
+
+
 # Dependency that checks the authentication
-def get_current_docs_username(credentials: HTTPBasicCredentials = Depends(security)):
+def get_current_docs_username(request: Request, credentials: HTTPBasicCredentials = Depends(security)):
     """
     Checks the HTTP basic authentication for access on the docs.
+    Both fields are compared in constant time and always both of them,
+    so the response time does not leak which part (or how much of it) was wrong.
+    Valid credentials are always accepted, only the wrong attempts of a client are limited.
     """
-    if credentials.username == DOCS_USERNAME and credentials.password == DOCS_PASSWORD:
-        return credentials.username
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Wrong username or password for the documentation",
-        headers={"WWW-Authenticate": "Basic"},
-    )
+
+    username_ok = hmac.compare_digest(credentials.username.encode("utf-8"), DOCS_USERNAME_B)
+    password_ok = hmac.compare_digest(credentials.password.encode("utf-8"), DOCS_PASSWORD_B)
+
+    if not (username_ok & password_ok):
+        if _count_failed_login(get_client_ip(request)) > DOCS_MAX_FAILED_LOGINS:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many failed login attempts for the documentation, please try again later",
+                headers={"Retry-After": str(DOCS_LOGIN_WINDOW_SECONDS)},
+            )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Wrong username or password for the documentation",
+            headers={"WWW-Authenticate": "Basic"},
+        )
+    return credentials.username
 
 
 docs_router = APIRouter(
@@ -1,34 +1,27 @@
 # Import of necessary parts of FastAPI
-from dns.e164 import query
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-
-# Import of or_ module as a filtering condition to avoid using '|'
-from sqlalchemy import or_
-
-# Import of SQLAlchemy Session (for type hints)
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Response, Query
+from fastapi.responses import ORJSONResponse
 
 from api.schemas import EmployeeUpdate, EmployeeCreate, Employee
-# Import of SQLAlchemy ORM models
-from database import models
 
 # Import of Pydantic schemas
 from api import schemas
 
-# Import of database dependency
-from database.database import get_db
-
 # Import of EmployeeService
 from services.employee_service import EmployeeService, get_employee_service
 
 from uuid import UUID
 from typing import List, Optional
 
+# Maximum number of employees accepted by one batch request
+MAX_EMPLOYEE_BATCH_SIZE = 500
+
 
 # Creates APIRouter instance
 employees_router = APIRouter(
     prefix="/employees",
     tags=["employees"],
+    default_response_class=ORJSONResponse,
 )
 
 @employees_router.post("/", response_model=schemas.Employee, status_code=status.HTTP_201_CREATED)
@@ -64,7 +57,38 @@ def create_employee(
 
     try:
         db_employee = employee_service.create_employee(employee_data=employee_data)  # <-- Aufruf des Service
-        return db_employee
+        return ORJSONResponse(db_employee.as_dict(), status_code=status.HTTP_201_CREATED)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@employees_router.post("/batch", response_model=List[schemas.Employee], status_code=status.HTTP_201_CREATED)
+def create_employees(
+        employees_data: List[EmployeeCreate] = Body(..., min_length=1, max_length=MAX_EMPLOYEE_BATCH_SIZE),
+        employee_service: EmployeeService = Depends(get_employee_service)
+):
+    """ **Endpoint to create several employees at once (one INSERT and one commit for all of them).**
+
+    **Args:**\n
+        employees_data (List[schemas.EmployeeCreate]): The employees to create (1 to 500 entries).\n
+        employee_service (EmployeeService): The injected EmployeeService instance.
+
+    **Returns:**\n
+        db_employees: The newly created employee objects (incl. the automatically generated
+        IDs and timestamps), in the order of the request.
+
+    **Raises:**\n
+        HTTPException: \n
+            - HTTP 400 Bad Request: If one of the phone numbers or e-mail addresses is already in the database (nothing is created).\n
+            - HTTP 422 Unprocessable Entity, Pydantic: If the input data is invalid.
+    """
+
+    try:
+        db_employees = employee_service.create_employees(employees_data=employees_data)
+        return ORJSONResponse([db_employee.as_dict() for db_employee in db_employees], status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -96,33 +120,38 @@ def get_employee_by_id(
     if not db_employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
 
-    return db_employee
+    return ORJSONResponse(db_employee.as_dict())
 
 
 @employees_router.get("/", response_model=List[schemas.Employee])
 def get_employees(
         name_query: Optional[str] = None,
+        after: Optional[UUID] = Query(None, description="ID of the last employee of the previous page."),
+        limit: int = Query(50, ge=1, le=500, description="Maximum number of employees per page."),
         employee_service: EmployeeService = Depends(get_employee_service)
 ):
     """ **Endpoint to retrieve list of employees.**
     **Case-insensitive, if name_query is provided, filters employees by name (case-insensitive, partial match).**
+    **Newest employees first, paginated: pass the ID of the last employee as 'after' to get the next page.**
 
     **Args:**\n
         name_query (Optional[str]): An optional string to filter employees by name.\n
+        after (Optional[UUID]): An optional employee ID, only employees after this one are returned.\n
+        limit (int): The maximum number of employees to return (default 50, max 500).\n
         employee_service (EmployeeService): The injected EmployeeService instance.
 
     **Returns:**
-        List[employee_schemas.Employee]: A list of all employees,\n
-        if name_query provided: A list of all employees matching the name query.
+        List[employee_schemas.Employee]: A page of all employees,\n
+        if name_query provided: A page of all employees matching the name query.
 
     **Raises:**
        HTTPException: - 422 Unprocessable Entity, Pydantic: If the input data is invalid.
 
     """
 
-    employees = employee_service.get_all_employees(name_query=name_query)
+    employees = employee_service.get_all_employees(name_query=name_query, after=after, limit=limit)
 
-    return employees
+    return ORJSONResponse([employee.as_dict() for employee in employees])
 
 @employees_router.patch("/{employee_id}", response_model=schemas.Employee, status_code=status.HTTP_200_OK)
 def update_employee(
@@ -166,7 +195,7 @@ def update_employee(
             employee_id=employee_id,
             employee_update_data=employee_update_data
         )
-        return db_employee
+        return ORJSONResponse(db_employee.as_dict())
 
     except ValueError as e:
 
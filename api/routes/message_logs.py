@@ -1,6 +1,6 @@
 # Import of necessary parts of FastAPI
-from dns.e164 import query
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Response
+from fastapi.responses import ORJSONResponse
 
 # Import of SQLAlchemy Session (for type hints)
 from sqlalchemy.orm import Session
@@ -17,15 +17,21 @@ from database.database import get_db
 # Import of MessageLogService
 from services.message_log_service import MessageLogService, get_message_log_service
 
+import logging
 from uuid import UUID
 from typing import List, Optional
-from sqlalchemy import desc
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of message logs accepted by one batch request
+MAX_MESSAGE_LOG_BATCH_SIZE = 500
 
 
 # Creates APIRouter instance
 message_log_router = APIRouter(
     prefix="/message_log",
     tags=["message_log"],
+    default_response_class=ORJSONResponse,
 )
 
 @message_log_router.post("/", response_model=schemas.MessageLog, status_code=status.HTTP_201_CREATED)
@@ -44,22 +50,53 @@ def create_message_log(
         ID and timestamp.
 
     Raises:
-        HTTPException: If the input data is invalid (422 Unprocessable Entity, Pydantic)
+        HTTPException:
+            - 404 Not Found: If the referenced employee does not exist
+            - 422 Unprocessable Entity, Pydantic: If the input data is invalid
 
     """
 
-    if message_log_data.employee_id:
-        db_employee = message_log_service.db.query(models.Employee).filter(
-            models.Employee.id == message_log_data.employee_id).first()
-        if not db_employee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Employee with ID {message_log_data.employee_id} not found."
-            )
+    try:
+        db_message_log = message_log_service.create_message_log(message_log_data=message_log_data)  # <-- Aufruf des Service
+        return ORJSONResponse(db_message_log.as_dict(), status_code=status.HTTP_201_CREATED)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
 
-    db_message_log = message_log_service.create_message_log(message_log_data=message_log_data)  # <-- Aufruf des Service
 
-    return db_message_log
+@message_log_router.post("/batch", response_model=List[schemas.MessageLog], status_code=status.HTTP_201_CREATED)
+def create_message_logs(
+        message_logs_data: List[schemas.MessageLogCreate] = Body(..., min_length=1, max_length=MAX_MESSAGE_LOG_BATCH_SIZE),
+        message_log_service: MessageLogService = Depends(get_message_log_service)
+):
+    """ Endpoint to create several message logs at once (one INSERT and one commit for all of them).
+
+    Args:
+        message_logs_data (List[MessageLogCreate]): The message logs to create (1 to 500 entries).
+        message_log_service (MessageLogService): The injected message log service instance.
+
+    Returns: db_message_logs: The newly created message_log objects incl. the automatically generated
+        IDs and timestamps, in the order of the request.
+
+    Raises:
+        HTTPException:
+            - 404 Not Found: If one of the referenced employees does not exist (nothing is created)
+            - 422 Unprocessable Entity, Pydantic: If the input data is invalid
+    """
+
+    try:
+        db_message_logs = message_log_service.create_message_logs(message_logs_data=message_logs_data)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    return ORJSONResponse([db_message_log.as_dict() for db_message_log in db_message_logs], status_code=status.HTTP_201_CREATED)
 
 
 @message_log_router.get("/last", response_model=schemas.MessageLog, status_code=status.HTTP_200_OK)
@@ -87,17 +124,18 @@ def get_latest_message_log(
             detail="No message logs found."
         )
 
-    db_employee = None
-    if db_message_log.employee_id:
-        db_employee = message_log_service.db.query(models.Employee).filter(
-            models.Employee.id == db_message_log.employee_id).first()
+    # The employee is loaded together with the message log
+    db_employee = db_message_log.employee
 
     employee_name = db_employee.name if db_employee else "N/A (Employee not found)"
 
-    # Logging new message status to the console
-    print(f"Message log: from/to: '{employee_name}', "
-          f"Status={db_message_log.status.value}, "
-          f"Direction={db_message_log.direction.value}, "
-          f"Content='{db_message_log.raw_message_content}'")
+    # Logging new message status (formatted by the logging thread, only if INFO is enabled)
+    logger.info(
+        "Message log: from/to: '%s', Status=%s, Direction=%s, Content='%s'",
+        employee_name,
+        db_message_log.status.value,
+        db_message_log.direction.value,
+        db_message_log.raw_message_content
+    )
 
-    return db_message_log
\ No newline at end of file
+    return ORJSONResponse(db_message_log.as_dict())
\ No newline at end of file
@@ -1,5 +1,6 @@
 # Import of necessary parts of FastAPI
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
+from fastapi.responses import ORJSONResponse
 
 # Import of or_ module as a filtering condition to avoid using '|'
 from sqlalchemy import or_
@@ -67,7 +68,7 @@ def create_product(
 
     try:
         db_product = product_service.create_product(product_data=product_data)  # calling the service
-        return db_product
+        return ORJSONResponse(db_product.as_dict(), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -77,54 +78,53 @@ def create_product(
 
 @product_router.get("/all", response_model=List[schemas.Product], status_code=status.HTTP_200_OK)
 def get_all_products(
+    after: Optional[UUID] = Query(None, description="ID of the last product of the previous page."),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of products per page."),
     product_service: ProductService = Depends(get_product_service)
 ):
     """ **Endpoint to get all products.**
+    **Newest products first, paginated: pass the ID of the last product as 'after' to get the next page.**
 
     **Args:**\n
+        after (Optional[UUID]): An optional product ID, only products after this one are returned.\n
+        limit (int): The maximum number of products to return (default 50, max 500).\n
         product_service (ProductService): The injected ProductService instance.
 
     **Returns:**\n
-        db_product: The list of all product objects.
-
-    **Raises:**\n
-        HTTPException:\n
-            - HTTP 404 Not Found:If the product cannot be found by the passed name.
+        db_product: A page of all product objects, an empty list past the last page.
 
     """
 
-    db_product = product_service.get_all_products()
-    if not db_product:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No products found")
+    db_product = product_service.get_all_products(after=after, limit=limit)
 
-    return db_product
+    return ORJSONResponse([product.as_dict() for product in db_product])
 
 
 @product_router.get("/search", response_model=List[schemas.Product], status_code=status.HTTP_200_OK)
 def search_products_by_name(
     name_query: str = Query(..., min_length=1, description="Search term for product name (case-insensitive, partial match)"),
+    after: Optional[UUID] = Query(None, description="ID of the last product of the previous page."),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of products per page."),
     product_service: ProductService = Depends(get_product_service)
 ):
     """ **Endpoint to search products by name using a query parameter.**
+    **Newest products first, paginated: pass the ID of the last product as 'after' to get the next page.**
 
     **Args:**\n
         name_query (str): The search term for the product name.\n
+        after (Optional[UUID]): An optional product ID, only products after this one are returned.\n
+        limit (int): The maximum number of products to return (default 50, max 500).\n
         product_service (ProductService): The injected ProductService instance.
 
     **Returns:**\n
-        db_product: A list of product objects matching the search term.
-
-    **Raises:**\n
-        HTTPException:\n
-            - HTTP 404 Not Found: If no products are found for the given search term.
+        db_product: A page of product objects matching the search term,
+        an empty list if nothing matches or past the last page.
 
     """
 
-    db_products = product_service.get_all_products(name_query=name_query)
-    if not db_products:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No products found with this name")
+    db_products = product_service.get_all_products(name_query=name_query, after=after, limit=limit)
 
-    return db_products
+    return ORJSONResponse([product.as_dict() for product in db_products])
 
 
 @product_router.get("/{product_id}", response_model=schemas.Product, status_code=status.HTTP_200_OK)
@@ -151,7 +151,7 @@ def get_product_by_id(
     if not db_product:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
-    return db_product
+    return ORJSONResponse(db_product.as_dict())
 
 
 @product_router.patch("/{product_id}", response_model=schemas.Product, status_code=status.HTTP_200_OK)
@@ -198,7 +198,7 @@ def update_product(
             product_id=product_id,
             product_update_data=product_update_data
         )
-        return db_product
+        return ORJSONResponse(db_product.as_dict())
 
     except ValueError as e:
 
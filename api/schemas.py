@@ -1,16 +1,96 @@
+import re
 import uuid
 import datetime
-from typing import Optional, Any
+from typing import Annotated, ClassVar, Optional, Any
 from decimal import Decimal
-from enum import Enum as PyEnum
 
 # Import BaseModel and ConfigDict for pydantic v2+
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
-from pydantic.v1 import UUID4
-from sqlalchemy import Boolean
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field, WithJsonSchema
 
-# IMport of Enums from SQLAlchemy models
-from database.models import UserRole, MessageDirection, MessageStatus
+# Import of the Enums shared with the SQLAlchemy models (without importing the ORM models)
+from database.enums import UserRole, MessageDirection, MessageStatus
+
+# Phone numbers in international format, compiled once for all models
+_PHONE_RE = re.compile(r"^\+\d{10,15}$")
+
+
+def _check_phone(value: str) -> str:
+    """ Validates a phone number against _PHONE_RE.
+
+    Raises: ValueError: If the phone number is not in international format
+
+    Returns: value: The unchanged phone number
+    """
+
+    if _PHONE_RE.fullmatch(value) is None:
+        raise ValueError("Phone number must start with '+' followed by 10 to 15 digits.")
+    return value
+
+
+# Shared phone number type, the JSON schema keeps the pattern for the API docs
+PhoneNumber = Annotated[
+    str,
+    AfterValidator(_check_phone),
+    WithJsonSchema({"type": "string", "pattern": _PHONE_RE.pattern}),
+]
+
+def _lowercase_email(value: str) -> str:
+    """ Email addresses are stored lowercase,
+    so they can be compared with '=' and the plain unique index.
+    """
+
+    return value.lower()
+
+
+# Shared e-mail type: validated by EmailStr (email_validator), then lowercased
+Email = Annotated[EmailStr, AfterValidator(_lowercase_email)]
+
+
+class ORMModel(BaseModel):
+    """ Base class for the response models. """
+
+    # Config allows Pydantic to load data from SQLAlchemy models,
+    # response models are read-only and keep enums as their plain values.
+    # The remaining options are Pydantic's defaults, set explicitly so the read path stays without
+    # assignment validation, instance revalidation and extra-keys handling if the defaults change
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True,
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances='never',
+        extra='ignore',
+    )
+
+
+class RequestModel(BaseModel):
+    """ Base class for the request models. """
+
+    # Request models build their validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
+
+class UpdateModel(RequestModel):
+    """ Base class for the update models.
+    Validates that at least one field is being updated.
+    """
+
+    # Fields named in the error message if nothing is sent
+    update_fields_hint: ClassVar[str] = "any field"
+
+    def model_post_init(self, context: Any) -> None:
+        """ Validation that at least one field is being updated.
+        __pydantic_fields_set__ (the set behind the model_fields_set property)
+        contains all fields that were sent in the request.
+        Pydantic reports the ValueError as a validation error (HTTP 422).
+
+        Raises: ValueError: If no field is given to update
+        """
+
+        # check that at least one field was sent
+        if not self.__pydantic_fields_set__:
+            raise ValueError(
+                f"At least one field ({self.update_fields_hint}) must be provided for update.")
 
 
 class EmployeeBase(BaseModel):
@@ -19,54 +99,38 @@ class EmployeeBase(BaseModel):
     """
 
     name: str = Field(min_length=1, max_length=255, examples=["Employee Dummy"], description="Mandatory: here goes the employee full name.")
-    phone_number: str = Field(pattern=r"^\+\d{10,15}$", examples=["+4917641208453"], description="Mandatory: here goes the employees phone number.")
+    phone_number: PhoneNumber = Field(examples=["+4917641208453"], description="Mandatory: here goes the employees phone number.")
     username: Optional[str] = Field(None, min_length=1, max_length=255, examples=["dummy321"], description="Optional: here goes the employees username.")
     hashed_password: Optional[str] = Field(None, min_length=8, max_length=255, examples=["find a strong password!"], description="Optional: here goes the employees personal password.")
-    email: EmailStr = Field(examples=["dummy@example.com"], description="Mandatory: here goes the employees email address.")
+    email: Email = Field(max_length=320, examples=["dummy@example.com"], description="Mandatory: here goes the employees email address.")
     role: UserRole = Field(examples=["general_user", "admin"], description="Mandatory: here goes the employees role.")
 
 
-class EmployeeCreate(EmployeeBase):
+class EmployeeCreate(EmployeeBase, RequestModel):
     """ Pydantic model for creating an Employee.
     But id, created_at, updated_at, magic_link_token etc. will be
     created by the server automatically and are not part of create request.
     Optionally for later.
     """
 
-    pass
 
-
-class EmployeeUpdate(EmployeeBase):
+class EmployeeUpdate(UpdateModel, EmployeeBase):
     """ Pydantic model for updating an Employee.
     All fields are optional because you don't want to update everything at the same time
     """
 
-    name: Optional[str] = Field(Field("Optional, str"), min_length=1, max_length=255)
-    phone_number: Optional[str] = Field(Field("Optional, str"), pattern=r"^\+\d{10,15}$")
-    username: Optional[str] = Field("Optional, str")
-    hashed_password: Optional[str] = Field("Optional, str")
-    email: Optional[EmailStr] = Field("Optional, EmailStr")
-    role: Optional[UserRole] = Field("Optional, 'general_user' or 'admin'")
-    is_authenticated: Optional[bool] = Field("Optional, true or false")
-
-    @model_validator(mode='after')
-    def check_at_least_one_field(self):
-        """ Validation that at least one field is being updated.
-        model_dump(exclude_none=True) returns all fields that are not 'None'.
-
-        Raises: ValueError: If no field is given (or not 'None') to update
+    name: Optional[str] = Field(default=None, min_length=1, max_length=255, description="Optional, str")
+    phone_number: Optional[PhoneNumber] = Field(default=None, description="Optional, str")
+    username: Optional[str] = Field(default=None, description="Optional, str")
+    hashed_password: Optional[str] = Field(default=None, description="Optional, str")
+    email: Optional[Email] = Field(default=None, max_length=320, description="Optional, EmailStr")
+    role: Optional[UserRole] = Field(default=None, description="Optional, 'general_user' or 'admin'")
+    is_authenticated: Optional[bool] = Field(default=None, description="Optional, true or false")
 
-        Returns: self: The current instance of EmployeeUpdate object that's being validated
-        """
+    update_fields_hint: ClassVar[str] = "name, phone_number, email, role"
 
-        # check that at least one field is not 'None'
-        if not any(self.model_dump(exclude_none=True).values()):
-            raise ValueError(
-                "At least one field (name, phone_number, email, role) must be provided for update.")
-        return self
 
-
-class Employee(EmployeeBase):
+class Employee(EmployeeBase, ORMModel):
     """ Model (inheriting from EmployeeBase) for the response of the API.
     Typically containing all fields that are relevant for the client, including
     server-generated fields.
@@ -77,22 +141,19 @@ class Employee(EmployeeBase):
     created_at: datetime.datetime
     updated_at: datetime.datetime
 
-    # Config allows Pydantic to load data from SQLAlchemy models
-    model_config = ConfigDict(from_attributes=True)
-
 
 
 class MessageLogBase(BaseModel):
     """ Pydantic model for MessageLog. """
 
     employee_id: Optional[uuid.UUID] = None
-    phone_number: str
+    phone_number: str = Field(max_length=32)
     direction: MessageDirection
     raw_message_content: str
     status: MessageStatus
 
 
-class MessageLogCreate(MessageLogBase):
+class MessageLogCreate(MessageLogBase, RequestModel):
     """ Pydantic model for creating a MessageLog entry.
     Fields like id, timestamp, AI interpretation, and system response
     are created by the server automatically
@@ -102,7 +163,7 @@ class MessageLogCreate(MessageLogBase):
     ai_interpreted_command: Optional[str] = None
 
 
-class MessageLogUpdate(BaseModel):
+class MessageLogUpdate(RequestModel):
     """ Pydantic model for updating a message log.
         All fields are optional because you don't want
         to update everything at the same time.
@@ -115,7 +176,7 @@ class MessageLogUpdate(BaseModel):
     status: Optional[MessageStatus] = None
 
 
-class MessageLog(MessageLogBase):
+class MessageLog(MessageLogBase, ORMModel):
     """
     Model (inheriting from MessageLogBase) for the response of the API.
     Typically containing all fields that are relevant for the client, including
@@ -128,9 +189,6 @@ class MessageLog(MessageLogBase):
     error_message: Optional[str] = None
     timestamp: datetime.datetime
 
-    # Config allows Pydantic to load data from SQLAlchemy models
-    model_config = ConfigDict(from_attributes=True)
-
 
 class ProductBase(BaseModel):
     """ Pydantic model for Products. """
@@ -149,7 +207,7 @@ class ProductBase(BaseModel):
     notes : Optional[str] = Field(None, examples=["An internal note about the product :)"], description="Optional: here goes an internal note about the product.")
 
 
-class ProductCreate(ProductBase):
+class ProductCreate(ProductBase, RequestModel):
     """
     Pydantic model for creating a Product entry.
     Fields like id and timestamps
@@ -157,49 +215,33 @@ class ProductCreate(ProductBase):
     and are not part of the create request.
     """
 
-    pass
 
-
-class ProductUpdate(BaseModel):
+class ProductUpdate(UpdateModel):
     """
     Pydantic model for updating a message log.
     All fields are optional because you don't want
     to update everything at the same time.
     """
 
-    name : Optional[str] = Field("Optional, str", min_length=1, max_length=255)
-    description: Optional[str] = Field("Optional, str")
-    product_manager_id: Optional[uuid.UUID] = Field("Optional, uuid")
-    length: Optional[Decimal] = Field("Optional, decimal")
-    height: Optional[Decimal] = Field("Optional, decimal")
-    width: Optional[Decimal] = Field("Optional, decimal")
-    weight: Optional[Decimal] = Field("Optional, decimal")
-    image_url: Optional[str] = Field("Optional, str")
-    price: Optional[Decimal] = Field("Optional, decimal, > 0", gt=0)
-    stock_quantity: Optional[int] = Field("Optional, int, >= 0", ge=0)
-    is_active: Optional[bool] = Field("Optional, true or false")
-    notes: Optional[str] = Field("Optional, str")
+    name: Optional[str] = Field(default=None, min_length=1, max_length=255, description="Optional, str")
+    description: Optional[str] = Field(default=None, description="Optional, str")
+    product_manager_id: Optional[uuid.UUID] = Field(default=None, description="Optional, uuid")
+    length: Optional[Decimal] = Field(default=None, description="Optional, decimal")
+    height: Optional[Decimal] = Field(default=None, description="Optional, decimal")
+    width: Optional[Decimal] = Field(default=None, description="Optional, decimal")
+    weight: Optional[Decimal] = Field(default=None, description="Optional, decimal")
+    image_url: Optional[str] = Field(default=None, description="Optional, str")
+    price: Optional[Decimal] = Field(default=None, gt=0, description="Optional, decimal, > 0")
+    stock_quantity: Optional[int] = Field(default=None, ge=0, description="Optional, int, >= 0")
+    is_active: Optional[bool] = Field(default=None, description="Optional, true or false")
+    notes: Optional[str] = Field(default=None, description="Optional, str")
 
     model_config = ConfigDict(extra='ignore')
 
-    @model_validator(mode='after')
-    def check_at_least_one_field(self):
-        """ Validation that at least one field is being updated.
-        model_dump(exclude_none=True) returns all fields that are not 'None'.
+    update_fields_hint: ClassVar[str] = "name, description, size, price etc."
 
-        Raises: ValueError: If no field is given (or not 'None') to update
 
-        Returns: self: The current instance of ProductUpdate object that's being validated
-        """
-
-        # check that at least one field is not 'None'
-        if not self.model_fields_set:
-            raise ValueError(
-                "At least one field (name, description, size, price etc.) must be provided for update.")
-        return self
-
-
-class Product(ProductBase):
+class Product(ProductBase, ORMModel):
     """
     Model (inheriting from ProductBase) for the response of the API.
     Typically containing all fields that are relevant for the client, including
@@ -210,6 +252,3 @@ class Product(ProductBase):
     product_manager: Optional[EmployeeBase] = None
     created_at: datetime.datetime
     updated_at: datetime.datetime
-
-    # Config allows Pydantic to load data from SQLAlchemy models
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
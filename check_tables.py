@@ -1,15 +1,41 @@
-# Import environment variables
-import os
 from dotenv import load_dotenv
-load_dotenv()
+
+from typing import Dict, List, Optional, Tuple
 
 from database.database import get_engine
 from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+# Reflected table names per database URL, so repeated calls skip the roundtrip
+_table_names_cache: Dict[str, Tuple[str, ...]] = {}
+
+
+def list_tables(engine: Optional[Engine] = None) -> List[str]:
+    """
+    Returns the names of the tables in the database.
+    The names are reflected once per database URL and cached afterwards.
+
+    Args:
+        engine (Engine): The engine to inspect (default: the engine from get_engine()).
+
+    Returns:
+        table_names (List[str]): The names of all tables found in the database.
+    """
+
+    engine = engine or get_engine()
+    url = str(engine.url)
+
+    if url not in _table_names_cache:
+        _table_names_cache[url] = tuple(inspect(engine).get_table_names())
+
+    return list(_table_names_cache[url])
+
 
-engine = get_engine()
-print(f"Connecting to engine at {engine.url}")
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
 
-inspector = inspect(engine)
-table_names = inspector.get_table_names()
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
 
-print("Tables found in the database:", table_names)
\ No newline at end of file
+    print("Tables found in the database:", list_tables(engine))
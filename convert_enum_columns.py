@@ -0,0 +1,42 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+# (table, column, PostgreSQL enum type / name of the CHECK constraint, allowed values)
+ENUM_COLUMNS = [
+    ("employees", "role", "userrole", ("admin", "general_user")),
+    ("message_logs", "direction", "messagedirection", ("inbound", "outbound")),
+    ("message_logs", "status", "messagestatus", ("received", "processed", "sent", "error")),
+]
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Converting enum columns to VARCHAR(16) with CHECK constraints...")
+
+    # The models store role, direction and status as VARCHAR(16) with a CHECK constraint instead of
+    # a native PostgreSQL enum. create_tables.py doesn't change existing tables, so they are converted here once
+    with engine.begin() as connection:
+        for table, column, type_name, values in ENUM_COLUMNS:
+            data_type = connection.execute(
+                text("SELECT data_type FROM information_schema.columns WHERE table_name = :table AND column_name = :column"),
+                {"table": table, "column": column}
+            ).scalar()
+            if data_type != "USER-DEFINED":
+                print(f"{table}.{column} is already converted, skipped.")
+                continue
+
+            allowed_values = ", ".join(f"'{value}'" for value in values)
+            connection.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(16) USING {column}::text"))
+            connection.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {type_name} CHECK ({column} IN ({allowed_values}))"))
+            connection.execute(text(f"DROP TYPE IF EXISTS {type_name}"))
+            print(f"{table}.{column} converted.")
+
+    print("Enum columns converted successfully!")
@@ -1,24 +1,25 @@
-# Import environment variables
-import os
 from dotenv import load_dotenv
-load_dotenv()
-
 
 # import of engine and base from database.py
 from database.database import get_engine, Base
 
-# import of all ORM models -> hint for SQLAlchemy what classes inherit from Base
-# and therefore are tables
-from database.models import Employee, Product, MessageLog
+# import of the ORM models module -> registers all classes that inherit from Base
+# and therefore are tables (SQLAlchemy only, the Pydantic schemas are not imported)
+import database.models
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
 
-engine = get_engine()
-print(f"Connecting to engine at {engine.url}")
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
 
-print("Creating database tables...")
+    print("Creating database tables...")
 
-# Creates all tables that inheriting from base and creates them
-# in the database that is connected to the engine
-# checkfirst=True avoids errors in case that tables exist already
-Base.metadata.create_all(bind=engine, checkfirst=True)
+    # Creates all tables that inheriting from base and creates them
+    # in the database that is connected to the engine
+    # checkfirst=True avoids errors in case that tables exist already
+    Base.metadata.create_all(bind=engine, checkfirst=True)
 
-print("Database tables created successfully!")
\ No newline at end of file
+    print("Database tables created successfully!")
@@ -1,30 +1,106 @@
 import os
+import threading
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
+from sqlalchemy.pool import NullPool
 
 
 # set up declarative base
 Base = declarative_base()
 
+# Entries of SQLAlchemy's compiled SQL cache (per engine, default 500). The statements of
+# database/queries.py need few entries, the filter/column combinations of the Telegram bot
+# queries (DatabaseQueryBuilder) many, with the larger cache they aren't evicted
+QUERY_CACHE_SIZE = 1200
+
 # Placeholders
 _engine = None
 _SessionLocal = None
+_init_lock = threading.Lock()
+
+def get_pool_settings():
+    """
+    Returns pool_size and max_overflow of the connection pool.
+    Both can be set with DB_POOL_SIZE and DB_MAX_OVERFLOW.
+    """
+
+    # Behind PgBouncer (transaction pooling) PgBouncer multiplexes the connections,
+    # so the app only keeps a few of its own
+    if os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true":
+        default_pool_size, default_max_overflow = 5, 0
+    else:
+        default_pool_size, default_max_overflow = 20, 10
+
+    pool_size = int(os.getenv("DB_POOL_SIZE", default_pool_size))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", default_max_overflow))
+    return pool_size, max_overflow
+
+
+def _create_engine():
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise Exception("DATABASE_URL environment variable not set.")
+
+    pool_size, max_overflow = get_pool_settings()
+
+    # The queries of this app are short OLTP statements, for them the JIT compilation
+    # of PostgreSQL only adds planning time. PgBouncer rejects the 'options' startup
+    # parameter, behind it JIT has to be disabled on the server (jit = off)
+    connect_args = {}
+    if os.getenv("DB_USE_PGBOUNCER", "false").lower() != "true":
+        connect_args["options"] = "-c jit=off"
+
+    # DB_POOL_CLASS=null: no connections are kept open by the app (serverless deploys or
+    # an external pooler like PgBouncer manage them). Every session opens a new connection,
+    # pool size, timeout and recycling don't apply then
+    if os.getenv("DB_POOL_CLASS", "").lower() == "null":
+        return create_engine(
+            database_url,
+            poolclass=NullPool,
+            query_cache_size=QUERY_CACHE_SIZE,
+            connect_args=connect_args
+        )
+
+    return create_engine(
+        database_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=1800,    # replaces connections before server/proxy idle timeouts drop them
+        pool_pre_ping=True,   # detects dead connections before handing them out
+        query_cache_size=QUERY_CACHE_SIZE,
+        connect_args=connect_args
+    )
+
+
+def init_db():
+    """
+    Creates the engine and the session factory, exactly once.
+    Called by the lifespan of the FastAPI app on startup; scripts and the Telegram bot
+    get it on their first get_engine()/get_session_local() call.
+    The lock makes sure that threads starting at the same time don't build two pools.
+    """
+
+    global _engine, _SessionLocal
+    with _init_lock:
+        if _engine is None:
+            _engine = _create_engine()
+        if _SessionLocal is None:
+            # expire_on_commit=False: rows returned by INSERT/UPDATE ... RETURNING stay loaded
+            # after the commit and are not fetched again when the response is serialized
+            _SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=_engine)
+    return _engine
+
 
 def get_engine():
-    global _engine
     if _engine is None:
-        database_url = os.getenv("DATABASE_URL")
-        if not database_url:
-            raise Exception("DATABASE_URL environment variable not set.")
-
-        _engine = create_engine(database_url)
+        init_db()
     return _engine
 
 
 def get_session_local():
-    global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+        init_db()
     return _SessionLocal
 
 
@@ -0,0 +1,24 @@
+# import of standard python libraries
+from enum import Enum as PyEnum
+
+
+class UserRole(PyEnum):
+    """ Class to define user role Enums according to DBMS scheme"""
+    admin = "admin"
+    general_user = "general_user"
+
+class MessageDirection(PyEnum):
+    """ Class to define message direction Enums according to DBMS scheme.
+    Can be either incoming (inbound) or outgoing (outbound) message.
+    """
+
+    inbound = "inbound"
+    outbound = "outbound"
+
+class MessageStatus(PyEnum):
+    """ Class to define status of message Enums according to DBMS scheme"""
+
+    received = "received"
+    processed = "processed"
+    sent = "sent"
+    error = "error"
@@ -1,11 +1,11 @@
 # import of standard python libraries
 import uuid
 import datetime
-from enum import Enum as PyEnum
+from typing import Optional
 
 # import of types and functions from SQLAlchemy
 from sqlalchemy import (
-    Boolean, BigInteger, Column, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+    DDL, Boolean, BigInteger, Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text, event, func, text
 )
 
 # import of postgreSQL specific types from SQLAlchemy
@@ -17,27 +17,26 @@ from sqlalchemy.orm import relationship
 # import of Base class from which all ORM models will inherit
 from .database import Base
 
+# Enums live in their own module, so the API schemas can import them without the ORM models
+from .enums import UserRole, MessageDirection, MessageStatus
 
-class UserRole(PyEnum):
-    """ Class to define user role Enums according to DBMS scheme"""
-    admin = "admin"
-    general_user = "general_user"
 
-class MessageDirection(PyEnum):
-    """ Class to define message direction Enums according to DBMS scheme.
-    Can be either incoming (inbound) or outgoing (outbound) message.
-    """
+# pg_trgm provides the trigram operator classes for the partial name search indexes below
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
-    inbound = "inbound"
-    outbound = "outbound"
 
-class MessageStatus(PyEnum):
-    """ Class to define status of message Enums according to DBMS scheme"""
+def _isoformat(value: Optional[datetime.datetime]) -> Optional[str]:
+    """ ISO 8601 string of a datetime, like the API schemas return it ('Z' for UTC). """
 
-    received = "received"
-    processed = "processed"
-    sent = "sent"
-    error = "error"
+    if value is None:
+        return None
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _str_or_none(value) -> Optional[str]:
+    """ str() of UUIDs and Decimals, None stays None. """
+
+    return str(value) if value is not None else None
 
 
 class Employee(Base):
@@ -45,22 +44,63 @@ class Employee(Base):
 
     __tablename__ = "employees"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String)
-    username = Column(String)
-    hashed_password = Column(String)
-    phone_number = Column(String, unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    # Lengths follow the limits of the API schemas (phone numbers: '+' and up to 15 digits, emails: RFC 5321)
+    name = Column(String(255))
+    username = Column(String(255))
+    hashed_password = Column(String(255))
+    phone_number = Column(String(32), unique=True, nullable=False, index=True)
     telegram_id = Column(BigInteger, unique=True, index=True, nullable=True)
-    email = Column(String, unique=True, nullable=False, index=True)
-    role = Column(Enum(UserRole), nullable=False)
+    email = Column(String(320), unique=True, nullable=False, index=True)
+    role = Column(Enum(UserRole, native_enum=False, create_constraint=True, length=16), nullable=False)
     is_authenticated = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=datetime.datetime.now(datetime.timezone.utc))
-    updated_at = Column(DateTime(timezone=True), default=datetime.datetime.now(datetime.timezone.utc),
-                        onupdate=datetime.datetime.now(datetime.timezone.utc))
+    # Timestamps are set by PostgreSQL (now() = start of the transaction) when a row is written
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Trigram index, lets PostgreSQL serve name ILIKE '%...%' without a sequential scan
+        Index("ix_employees_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        # Same for the partial email and phone number filters of the Telegram bot queries (DatabaseQueryBuilder)
+        Index("ix_employees_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index("ix_employees_phone_number_trgm", "phone_number", postgresql_using="gin", postgresql_ops={"phone_number": "gin_trgm_ops"}),
+        # Serves the (created_at, id) ordering and cursor of the paginated employee list
+        Index("ix_employees_created_at_id", "created_at", "id"),
+    )
+
+    # ORM flushes read the database generated values (ids, timestamps) back with RETURNING,
+    # also on UPDATE, instead of expiring them and loading them with an extra SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Definition of relationship to other models
-    managed_products = relationship("Product", back_populates="product_manager")
-    message_logs = relationship("MessageLog", back_populates="employee")
+    # passive_deletes=True: on delete, PostgreSQL sets the foreign keys of products and message logs
+    # to NULL (ON DELETE SET NULL), the ORM doesn't load them first to do it itself
+    managed_products = relationship("Product", back_populates="product_manager", passive_deletes=True)
+    message_logs = relationship("MessageLog", back_populates="employee", passive_deletes=True)
+
+    def as_dict(self, base_only: bool = False) -> dict:
+        """ Plain dict of the API fields (schemas.Employee, or schemas.EmployeeBase if base_only),
+        ready to be serialized without going through Pydantic.
+        """
+
+        employee_dict = {
+            "name": self.name,
+            "phone_number": self.phone_number,
+            "username": self.username,
+            "hashed_password": self.hashed_password,
+            "email": self.email,
+            "role": self.role.value,
+        }
+        if base_only:
+            return employee_dict
+
+        employee_dict.update(
+            id=str(self.id),
+            is_authenticated=self.is_authenticated,
+            created_at=_isoformat(self.created_at),
+            updated_at=_isoformat(self.updated_at),
+        )
+        return employee_dict
 
 
 class Product(Base):
@@ -68,9 +108,9 @@ class Product(Base):
 
     __tablename__ = "products"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False)
-    product_manager_id = Column(UUID(as_uuid=True), ForeignKey("employees.id"), nullable=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    name = Column(String(255), nullable=False)
+    product_manager_id = Column(UUID(as_uuid=True), ForeignKey("employees.id", ondelete="SET NULL"), nullable=True, index=True)
     description = Column(Text)
     length = Column(Numeric(10, 2))
     height = Column(Numeric(10, 2))
@@ -81,27 +121,95 @@ class Product(Base):
     stock_quantity = Column(Integer, nullable=False, default=0)
     is_active = Column(Boolean, default=True)
     notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), default=datetime.datetime.now(datetime.timezone.utc))
-    updated_at = Column(DateTime(timezone=True), default=datetime.datetime.now(datetime.timezone.utc), onupdate=datetime.datetime.now(datetime.timezone.utc))
+    # Timestamps are set by PostgreSQL (now() = start of the transaction) when a row is written
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Trigram index, lets PostgreSQL serve name ILIKE '%...%' without a sequential scan
+        Index("ix_products_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        # Same for the partial description filters of the Telegram bot queries (DatabaseQueryBuilder)
+        Index("ix_products_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        # Serves the (created_at, id) ordering and cursor of the paginated product lists
+        Index("ix_products_created_at_id", "created_at", "id"),
+    )
+
+    # ORM flushes read the database generated values (ids, timestamps) back with RETURNING,
+    # also on UPDATE, instead of expiring them and loading them with an extra SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Definition of relationship to other models
-    product_manager = relationship("Employee", back_populates="managed_products")
+    # lazy="raise": the queries that return the product manager load it explicitly (joinedload),
+    # all others don't join the employees table and can't trigger a SELECT per product
+    product_manager = relationship("Employee", back_populates="managed_products", lazy="raise")
+
+    def as_dict(self) -> dict:
+        """ Plain dict of the API fields (schemas.Product), ready to be serialized without going through Pydantic.
+        The product manager should be loaded together with the product (joinedload).
+        """
+
+        return {
+            "name": self.name,
+            "description": self.description,
+            "product_manager_id": _str_or_none(self.product_manager_id),
+            "length": _str_or_none(self.length),
+            "height": _str_or_none(self.height),
+            "width": _str_or_none(self.width),
+            "weight": _str_or_none(self.weight),
+            "image_url": self.image_url,
+            "price": _str_or_none(self.price),
+            "stock_quantity": self.stock_quantity,
+            "is_active": self.is_active,
+            "notes": self.notes,
+            "id": str(self.id),
+            "product_manager": self.product_manager.as_dict(base_only=True) if self.product_manager else None,
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+        }
+
 
 class MessageLog(Base):
     """ Definition of ORM model class/ table 'MessageLog' """
 
     __tablename__ = "message_logs"
 
+    # Generated in Python (not by gen_random_uuid() like the other ids): the batch insert needs
+    # client side keys to send all rows in one INSERT ... RETURNING and match them to the input order
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    employee_id = Column(UUID(as_uuid=True), ForeignKey("employees.id"), nullable=True)
-    phone_number = Column(String, nullable=False, index=True)
-    direction = Column(Enum(MessageDirection), nullable=False)
+    employee_id = Column(UUID(as_uuid=True), ForeignKey("employees.id", ondelete="SET NULL"), nullable=True)
+    # Phone number of the employee or 'telegram:<telegram user id>'
+    phone_number = Column(String(32), nullable=False, index=True)
+    direction = Column(Enum(MessageDirection, native_enum=False, create_constraint=True, length=16), nullable=False)
     raw_message_content = Column(Text, nullable=False)
     ai_interpreted_command = Column(JSONB)
     system_response_content = Column(String, nullable=True)
-    status = Column(Enum(MessageStatus), nullable=False)
+    status = Column(Enum(MessageStatus, native_enum=False, create_constraint=True, length=16), nullable=False)
     error_message = Column(Text)
-    timestamp = Column(DateTime(timezone=True), default=datetime.datetime.now(datetime.timezone.utc), index=True)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        # Serves the message history of an employee (newest first) and the foreign key lookups
+        # of employees.id, e.g. when an employee is deleted. The timestamp index above stays for
+        # the latest message log over all employees
+        Index("ix_message_logs_employee_id_timestamp", "employee_id", timestamp.desc()),
+    )
 
     # Definition of relationship to other models
-    employee = relationship("Employee", back_populates="message_logs")
\ No newline at end of file
+    # lazy="raise": the employee has to be loaded explicitly (joinedload), no hidden extra SELECT per log
+    employee = relationship("Employee", back_populates="message_logs", lazy="raise")
+
+    def as_dict(self) -> dict:
+        """ Plain dict of the API fields (schemas.MessageLog), ready to be serialized without going through Pydantic. """
+
+        return {
+            "employee_id": _str_or_none(self.employee_id),
+            "phone_number": self.phone_number,
+            "direction": self.direction.value,
+            "raw_message_content": self.raw_message_content,
+            "status": self.status.value,
+            "id": str(self.id),
+            "ai_interpreted_command": self.ai_interpreted_command,
+            "system_response_content": self.system_response_content,
+            "error_message": self.error_message,
+            "timestamp": _isoformat(self.timestamp),
+        }
@@ -0,0 +1,68 @@
+# Statements of the hot request paths, built once at import and executed with bind parameters.
+# Every execution reuses the same statement object, so SQLAlchemy finds the compiled SQL
+# in its compiled cache without building the statement again.
+from sqlalchemy import bindparam, desc, exists, select, update
+from sqlalchemy.orm import joinedload
+
+from database import models
+
+
+# Magic link: authenticates the employee with the given ID and (lowercase) email, if not authenticated yet.
+# Params: token_employee_id, token_email (names of UPDATE bind params must differ from the column names)
+AUTHENTICATE_IF_PENDING = (
+    update(models.Employee)
+    .where(
+        models.Employee.id == bindparam("token_employee_id"),
+        models.Employee.email == bindparam("token_email"),
+        models.Employee.is_authenticated.is_(False)
+    )
+    .values(is_authenticated=True)
+    .returning(models.Employee.id)
+)
+
+# Magic link: whether an employee with the given ID and (lowercase) email exists (EXISTS, no row is returned).
+# Params: token_employee_id, token_email (same as AUTHENTICATE_IF_PENDING)
+EMPLOYEE_EXISTS_BY_ID_AND_EMAIL = select(
+    exists().where(
+        models.Employee.id == bindparam("token_employee_id"),
+        models.Employee.email == bindparam("token_email")
+    )
+)
+
+# Telegram bot: links the Telegram account to the employee, if it isn't linked to it already.
+# Returns the updated employee, no row if the ID is unknown or the Telegram ID is unchanged.
+# Params: link_employee_id, link_telegram_id (names of UPDATE bind params must differ from the column names)
+SET_TELEGRAM_ID_IF_CHANGED = (
+    update(models.Employee)
+    .where(
+        models.Employee.id == bindparam("link_employee_id"),
+        models.Employee.telegram_id.is_distinct_from(bindparam("link_telegram_id"))
+    )
+    .values(telegram_id=bindparam("link_telegram_id"))
+    .returning(models.Employee)
+    # An employee already loaded in the session is overwritten with the returned row
+    .execution_options(populate_existing=True)
+)
+
+# Employee linked to the given Telegram account. Params: telegram_id
+EMPLOYEE_BY_TELEGRAM_ID = (
+    select(models.Employee)
+    .where(models.Employee.telegram_id == bindparam("telegram_id"))
+    .limit(1)
+)
+
+# Employee with the given phone number. Params: phone_number
+EMPLOYEE_BY_PHONE_NUMBER = (
+    select(models.Employee)
+    .where(models.Employee.phone_number == bindparam("phone_number"))
+    .limit(1)
+)
+
+# The most recently added message log together with the name of its employee
+# (the only employee column the caller logs, the other columns are not selected), no params
+LATEST_MESSAGE_LOG = (
+    select(models.MessageLog)
+    .options(joinedload(models.MessageLog.employee).load_only(models.Employee.name))
+    .order_by(desc(models.MessageLog.timestamp))
+    .limit(1)
+)
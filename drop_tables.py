@@ -1,21 +1,23 @@
-# Import environment variables
-import os
 from dotenv import load_dotenv
-load_dotenv()
 
 # Import of engine and Base from database.py
 from database.database import get_engine, Base
 
-# import of all ORM models -> hint for SQLAlchemy what classes inherit from Base
-# and therefore are tables
-from database.models import Employee, Product, MessageLog
+# import of the ORM models module -> registers all classes that inherit from Base
+# and therefore are tables (SQLAlchemy only, the Pydantic schemas are not imported)
+import database.models
 
-engine = get_engine()
-print(f"Connecting to engine at {engine.url}")
 
-print("Dropping database tables...")
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
 
-# Drops all tables
-Base.metadata.drop_all(bind=engine)
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
 
-print("Database tables dropped successfully!")
\ No newline at end of file
+    print("Dropping database tables...")
+
+    # Drops all tables
+    Base.metadata.drop_all(bind=engine)
+
+    print("Database tables dropped successfully!")
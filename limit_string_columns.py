@@ -0,0 +1,34 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+# (table, column, maximum length) as declared in database/models.py
+STRING_COLUMNS = [
+    ("employees", "name", 255),
+    ("employees", "username", 255),
+    ("employees", "hashed_password", 255),
+    ("employees", "phone_number", 32),
+    ("employees", "email", 320),
+    ("products", "name", 255),
+    ("message_logs", "phone_number", 32),
+]
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Adding maximum lengths to the string columns...")
+
+    # create_tables.py doesn't change existing tables, so the lengths are added here once.
+    # Fails (and changes nothing) if a stored value is longer, these rows have to be fixed manually first
+    with engine.begin() as connection:
+        for table, column, length in STRING_COLUMNS:
+            connection.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR({length})"))
+
+    print("String column lengths added successfully!")
@@ -0,0 +1,23 @@
+from dotenv import load_dotenv
+
+# import of engine from database.py
+from database.database import get_engine
+from sqlalchemy import text
+
+
+if __name__ == "__main__":
+    # Import environment variables
+    load_dotenv()
+
+    engine = get_engine()
+    print(f"Connecting to engine at {engine.url}")
+
+    print("Lowercasing employee email addresses...")
+
+    # Email addresses are stored lowercase since the schemas normalize them,
+    # rows created before that are updated once here.
+    # Fails (and changes nothing) if two addresses only differ in case, these have to be merged manually
+    with engine.begin() as connection:
+        result = connection.execute(text("UPDATE employees SET email = lower(email) WHERE email <> lower(email)"))
+
+    print(f"{result.rowcount} email addresses lowercased successfully!")
@@ -1,18 +1,46 @@
 from dotenv import load_dotenv
 
-from api.routes.products import product_router
-
 load_dotenv()
 
+import os
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import ORJSONResponse
 
 # Import of router
 from api.routes import employees, message_logs, auth, products, docs
 
+from utils.logging_utils import setup_logging, shutdown_logging
+
+from database.database import get_pool_settings, init_db
+
+# Number of worker threads for the sync (def) endpoints, which hold a pooled DB connection
+# for most of their runtime. By default one thread per connection the pool can hand out:
+# more threads would only wait for a connection, fewer would leave connections unused.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "0")) or sum(get_pool_settings())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs once on startup (before yield) and once on shutdown (after yield).
+    """
+
+    setup_logging(os.getenv("LOG_LEVEL", "INFO").upper())
+    init_db()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    auth.load_magic_link_templates()
+    yield
+    shutdown_logging()
+
+
 app = FastAPI(
     docs_url=None,
-    redoc_url=None
+    redoc_url=None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse    # JSON bodies (incl. error details) are encoded by orjson
 )
 
 
@@ -26,7 +54,6 @@ app.include_router(employees.employees_router)
 app.include_router(products.product_router)
 
 # linking the auth_router with main.py
-templates = Jinja2Templates(directory="templates")
 app.include_router(auth.auth_router)
 
 # linking the docs_router with main.py
@@ -1,93 +1,244 @@
 from sqlalchemy.orm import Session, aliased, joinedload
-from sqlalchemy import text
-from typing import Dict, Any, List, Type, Optional, Tuple
+from sqlalchemy import Boolean, Enum, String, bindparam, select, text
+from typing import Callable, Dict, Any, List, Type, Optional, Tuple
 from uuid import UUID
 import datetime
+import functools
 from decimal import Decimal
 from fastapi import Depends
 from database.database import get_db
+from utils.search_utils import LIKE_ESCAPE_CHARACTER, contains_pattern
 
 # Import of ORM Models
 from database.models import Employee, Product
 from database.database import Base
 
-class DatabaseQueryBuilder:
-    def __init__(self, db: Session):
-        self.db = db
-        # Mapping of table names (as expected from the LLM) to the ORM models
-        self.model_map: Dict[str, Type[Base]] = {
-            "employees": Employee,
-            "products": Product
-        }
-
-    def _build_query(self, table_name: str,
-                     filters: Dict[str, Any],
-                     columns: List[str],
-                     join_table: Optional[str] = None,
-                     join_on: Optional[str] = None,
-                     join_columns: Optional[List[str]] = None):
-        """
-        Builds a SQLAlchemy ORM query based on the LLM's parsed intent.
-        """
+# Mapping of table names (as expected from the LLM) to the ORM models
+MODEL_MAP: Dict[str, Type[Base]] = {
+    "employees": Employee,
+    "products": Product
+}
 
-        primary_model = self.model_map.get(table_name)
-        if not primary_model:
-            raise ValueError(f"Unknown primary table name: {table_name}")
+# Column attributes of every model by column name, collected once at import.
+# Queries look the requested columns up here instead of probing the models with hasattr/getattr
+COLUMN_ATTRIBUTES: Dict[str, Dict[str, Any]] = {
+    table_name: {column.name: getattr(model, column.name) for column in model.__table__.columns}  # type: ignore
+    for table_name, model in MODEL_MAP.items()
+}
 
-        query_entities = []
-        # If specific columns are requested from the primary table, add them.
-        if columns and '*' not in columns:
-            query_entities = [getattr(primary_model, col) for col in columns if hasattr(primary_model, col)]
-        else:
-            # If '*' is requested, select all columns from the primary model for explicit selection.
-            query_entities = [c for c in primary_model.__table__.columns]  # type: ignore
 
-        query = self.db.query(*query_entities)  # Start query with the explicitly selected primary model entities
+def _identity(value: Any) -> Any:
+    return value
 
-        # Handle JOIN logic
-        if join_table and join_on and join_columns is not None:
-            joined_model = self.model_map.get(join_table)
-            if not joined_model:
-                raise ValueError(f"Unknown join_table name: {join_table}")
 
-            # Determine the relationship name based on the foreign key column.
-            # For 'product_manager_id' column, the relationship is typically 'product_manager'.
-            relationship_name = join_on.replace('_id', '') if join_on.endswith('_id') else join_on
+def _skip_none(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wraps a converter so that NULL values stay None."""
 
-            if not hasattr(primary_model, relationship_name):
-                raise ValueError(
-                    f"Relationship '{relationship_name}' not found on primary table '{table_name}' for join.")
+    return lambda value: None if value is None else convert(value)
 
-            # Perform the JOIN using the SQLAlchemy relationship. This is crucial for avoiding Cartesian products.
-            query = query.join(getattr(primary_model, relationship_name))
 
-            # Add columns from the joined table to the selected entities
-            for col in join_columns:
-                if hasattr(joined_model, col):
-                    query_entities.append(getattr(joined_model, col))
-                else:
-                    raise ValueError(f"Requested join_column '{col}' not found in join_table '{join_table}'.")
-
-            # Update the query with the combined list of selected entities from both tables
-            query = query.with_entities(*query_entities)
-
-        # Apply filters to the query.
-        for col_name, value in filters.items():
-            target_model = primary_model
-            # Determine if the filter column belongs to the primary or joined model
-            if not hasattr(primary_model, col_name) and join_table and hasattr(joined_model, col_name):
-                target_model = joined_model
-
-            if isinstance(value, str):
-                query = query.filter(getattr(target_model, col_name).ilike(f"%{value}%"))
-            elif isinstance(value, UUID):
-                query = query.filter(getattr(target_model, col_name) == value)
+def _result_converter(column) -> Callable[[Any], Any]:
+    """
+    Returns the function that makes a value of the column JSON friendly:
+    UUIDs become strings, datetimes ISO strings and decimals floats, other values stay as they are.
+    """
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return _identity
+
+    if issubclass(python_type, UUID):
+        return _skip_none(str)
+    if issubclass(python_type, datetime.datetime):
+        return _skip_none(datetime.datetime.isoformat)
+    if issubclass(python_type, Decimal):
+        return _skip_none(float)
+    return _identity
+
+
+# Result converter of every column by column name, picked once from the column types
+# instead of checking the type of every single value of a result
+COLUMN_CONVERTERS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    table_name: {column.name: _result_converter(column) for column in model.__table__.columns}  # type: ignore
+    for table_name, model in MODEL_MAP.items()
+}
+
+
+# Kinds of filters
+FILTER_CONTAINS = "contains"  # text columns (String, Text): case-insensitive substring match
+FILTER_EQUALS = "equals"      # all other columns, Enum columns included
+FILTER_IS_NULL = "is_null"    # None as filter value, on any column
+
+# Filter kind of every column by column name, picked once from the column types
+# instead of checking the type of every filter value
+COLUMN_FILTER_KINDS: Dict[str, Dict[str, str]] = {
+    table_name: {
+        column.name: FILTER_CONTAINS if isinstance(column.type, String) and not isinstance(column.type, Enum)
+        else FILTER_EQUALS
+        for column in model.__table__.columns  # type: ignore
+    }
+    for table_name, model in MODEL_MAP.items()
+}
+
+
+def _contains_value(value: Any) -> str:
+    """Bound value of a substring filter, wildcards in the value are matched literally."""
+
+    return contains_pattern(str(value))
+
+
+# Boolean filter values as the LLM writes them
+BOOLEAN_FILTER_VALUES = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _boolean_value(value: Any) -> bool:
+    """Bound value of a filter on a Boolean column, "true"/"false"/"1"/"0" become bools."""
+
+    if isinstance(value, bool):
+        return value
+
+    boolean = BOOLEAN_FILTER_VALUES.get(str(value).strip().lower())
+    if boolean is None:
+        raise ValueError(f"Invalid boolean filter value '{value}'.")
+    return boolean
+
+
+def _enum_value_converter(enum_class) -> Callable[[Any], Any]:
+    """Returns the function that turns a filter value into the member of the enum with that value (case-insensitive)."""
+
+    members = {str(member.value).lower(): member for member in enum_class}
+
+    def convert(value: Any) -> Any:
+        member = members.get(str(getattr(value, "value", value)).strip().lower())
+        if member is None:
+            raise ValueError(f"Invalid filter value '{value}', expected one of: {', '.join(members)}.")
+        return member
+
+    return convert
+
+
+def _equals_converter(column) -> Callable[[Any], Any]:
+    """Returns the function that turns a filter value into the bound value of an equality filter on the column."""
+
+    if isinstance(column.type, Boolean):
+        return _boolean_value
+    if isinstance(column.type, Enum) and column.type.enum_class is not None:
+        return _enum_value_converter(column.type.enum_class)
+    return _identity
+
+
+# Converter of the values of equality filters by column name, picked once from the column types
+EQUALS_CONVERTERS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    table_name: {column.name: _equals_converter(column) for column in model.__table__.columns}  # type: ignore
+    for table_name, model in MODEL_MAP.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _build_statement(table_name: str,
+                     columns: Tuple[str, ...],
+                     join_table: Optional[str],
+                     join_on: Optional[str],
+                     join_columns: Optional[Tuple[str, ...]],
+                     filter_shape: Tuple[Tuple[str, bool], ...],
+                     limited: bool):
+    """
+    Builds the SELECT statement for one shape of the LLM's parsed intent (tables, columns, filtered columns
+    and whether their filter value is None, without the filter values and the limit) together with the
+    result column converters and the converters of the filter values (None for filters without a value).
+    The filter values and the limit are bind parameters (filter_0, filter_1, ... in the order of filter_shape
+    and limit), so the LLM asking the same kind of question again reuses the built statement.
+    """
+
+    primary_model = MODEL_MAP.get(table_name)
+    if not primary_model:
+        raise ValueError(f"Unknown primary table name: {table_name}")
+
+    primary_columns = COLUMN_ATTRIBUTES[table_name]
+    primary_converters = COLUMN_CONVERTERS[table_name]
+    joined_columns: Dict[str, Any] = {}
+    filter_kinds = COLUMN_FILTER_KINDS[table_name]
+    equals_converters = EQUALS_CONVERTERS[table_name]
+
+    # If specific columns are requested from the primary table, select them (unknown ones are skipped).
+    # If '*' is requested, select all columns from the primary model for explicit selection.
+    if columns and '*' not in columns:
+        selected = [col for col in columns if col in primary_columns]
+    else:
+        selected = list(primary_columns)
+
+    query_entities = [primary_columns[col] for col in selected]
+    name_converters = [(col, primary_converters[col]) for col in selected]
+
+    # Handle JOIN logic
+    relationship = None
+    if join_table and join_on and join_columns is not None:
+        joined_model = MODEL_MAP.get(join_table)
+        if not joined_model:
+            raise ValueError(f"Unknown join_table name: {join_table}")
+        joined_columns = COLUMN_ATTRIBUTES[join_table]
+        joined_converters = COLUMN_CONVERTERS[join_table]
+        filter_kinds = {**COLUMN_FILTER_KINDS[join_table], **filter_kinds}
+        equals_converters = {**EQUALS_CONVERTERS[join_table], **equals_converters}
+
+        # Determine the relationship name based on the foreign key column.
+        # For 'product_manager_id' column, the relationship is typically 'product_manager'.
+        relationship_name = join_on.replace('_id', '') if join_on.endswith('_id') else join_on
+
+        if not hasattr(primary_model, relationship_name):
+            raise ValueError(
+                f"Relationship '{relationship_name}' not found on primary table '{table_name}' for join.")
+        relationship = getattr(primary_model, relationship_name)
+
+        # Add columns from the joined table to the selected entities
+        for col in join_columns:
+            if col in joined_columns:
+                query_entities.append(joined_columns[col])
+                name_converters.append((col, joined_converters[col]))
             else:
-                query = query.filter(getattr(target_model, col_name) == value)
+                raise ValueError(f"Requested join_column '{col}' not found in join_table '{join_table}'.")
+
+    stmt = select(*query_entities)
+
+    # Perform the JOIN using the SQLAlchemy relationship. This is crucial for avoiding Cartesian products.
+    if relationship is not None:
+        stmt = stmt.join(relationship)
+
+    # Filterable columns of the primary and the joined model.
+    # A column name present in both tables refers to the primary table
+    filter_columns = {**joined_columns, **primary_columns} if joined_columns else primary_columns
+
+    # Apply filters to the statement.
+    value_converters = []
+    for i, (col_name, is_null) in enumerate(filter_shape):
+        column = filter_columns.get(col_name)
+        if column is None:
+            raise ValueError(f"Filter column '{col_name}' not found in table '{table_name}'.")
+
+        kind = FILTER_IS_NULL if is_null else filter_kinds[col_name]
+        if kind == FILTER_CONTAINS:
+            # Substring match, served by the pg_trgm GIN indexes of the searched text columns
+            stmt = stmt.where(column.ilike(bindparam(f"filter_{i}"), escape=LIKE_ESCAPE_CHARACTER))
+            value_converters.append(_contains_value)
+        elif kind == FILTER_IS_NULL:
+            stmt = stmt.where(column.is_(None))
+            value_converters.append(None)
+        else:
+            stmt = stmt.where(column == bindparam(f"filter_{i}"))
+            value_converters.append(equals_converters[col_name])
+
+    if limited:
+        stmt = stmt.limit(bindparam("limit"))
 
-        return query
+    return stmt, tuple(name_converters), tuple(value_converters)
 
 
+class DatabaseQueryBuilder:
+    def __init__(self, db: Session):
+        self.db = db
+        self.model_map = MODEL_MAP
+
     def execute_query(self, query_intent: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Executes a database query based on the LLM's parsed intent and returns results.
@@ -97,7 +248,7 @@ class DatabaseQueryBuilder:
         table_name = query_intent.get("table")
         action = query_intent.get("action")
         columns = query_intent.get("columns", ["*"])
-        filters = query_intent.get("filters", {})
+        filters = query_intent.get("filters") or {}
         raw_limit = query_intent.get("limit", None)
 
         join_table = query_intent.get("join_table")
@@ -124,81 +275,49 @@ class DatabaseQueryBuilder:
 
         try:
             primary_model = self.model_map.get(table_name)
-            if not primary_model:  # Should ideally be caught by _build_query
+            if not primary_model:  # Should ideally be caught by _build_statement
                 raise ValueError(f"Unknown table name: {table_name}")
 
-            query = self._build_query(table_name, filters, columns, join_table, join_on, join_columns)
+            # The statement is built once per shape of the intent, the values are passed as parameters
+            filter_items = sorted(filters.items())
+            filter_shape = tuple((col_name, value is None) for col_name, value in filter_items)
+            limited = limit is not None and limit > 0
+
+            stmt, name_converters, value_converters = _build_statement(
+                table_name,
+                tuple(columns) if columns else (),
+                join_table,
+                join_on,
+                tuple(join_columns) if join_columns is not None else None,
+                filter_shape,
+                limited
+            )
+
+            params: Dict[str, Any] = {
+                f"filter_{i}": convert(value)
+                for i, ((col_name, value), convert) in enumerate(zip(filter_items, value_converters))
+                if convert is not None
+            }
+            if limited:
+                params["limit"] = limit
+
+            results = self.db.execute(stmt, params)
+
+            # The results are rows in the order of the selected columns, each row
+            # is formatted with the converters of its columns, without type checks
+            formatted_results = [
+                {col_name: convert(val) for (col_name, convert), val in zip(name_converters, row)}
+                for row in results
+            ]
 
-            if limit is not None and limit > 0:
-                query = query.limit(limit)
-
-            results = query.all()
-
-            formatted_results = []
-            # Logic to correctly format results, handling both tuples (from with_entities/joins)
-            # and ORM objects (from simple '*' selects without joins).
-            if join_table and join_on and join_columns is not None:
-                # For JOIN queries, results are tuples. Reconstruct column names from intent.
-                final_column_names = []
-                if columns and '*' not in columns:
-                    final_column_names.extend(columns)
-                else:
-                    final_column_names.extend([c.name for c in primary_model.__table__.columns])  # type: ignore
-                if join_columns:
-                    final_column_names.extend(join_columns)
-
-                for result_tuple in results:
-                    row_dict = {}
-                    # Map tuple values to their corresponding column names.
-                    for i, col_name in enumerate(final_column_names):
-                        val = result_tuple[i]
-                        if isinstance(val, UUID):
-                            row_dict[col_name] = str(val)
-                        elif isinstance(val, datetime.datetime):
-                            row_dict[col_name] = val.isoformat()
-                        elif isinstance(val, Decimal):
-                            row_dict[col_name] = float(val)
-                        else:
-                            row_dict[col_name] = val
-                    formatted_results.append(row_dict)
-            else:
-                # For single-table queries, results might be ORM objects or tuples.
-                for result_item in results:
-                    row_dict = {}
-                    if columns and '*' not in columns:
-                        # Specific columns requested, result is a tuple.
-                        for i, col_name in enumerate(columns):
-                            val = result_item[i]  # Expecting a tuple here
-                            if isinstance(val, UUID):
-                                row_dict[col_name] = str(val)
-                            elif isinstance(val, datetime.datetime):
-                                row_dict[col_name] = val.isoformat()
-                            elif isinstance(val, Decimal):
-                                row_dict[col_name] = float(val)
-                            else:
-                                row_dict[col_name] = val
-                    else:
-                        # All columns ('*') requested, result is an ORM object.
-                        for col in primary_model.__table__.columns:  # type: ignore
-                            col_name = col.name
-                            val = getattr(result_item, col_name)
-                            if isinstance(val, UUID):
-                                row_dict[col_name] = str(val)
-                            elif isinstance(val, datetime.datetime):
-                                row_dict[col_name] = val.isoformat()
-                            elif isinstance(val, Decimal):
-                                row_dict[col_name] = float(val)
-                            else:
-                                row_dict[col_name] = val
-                    formatted_results.append(row_dict)
-
-            print(f"Database query successful! Result: {formatted_results}")
             return formatted_results
 
         except ValueError as ve:
             print(f"ERROR: Failed during building/ processing the query (ValueError): {ve}")
             return [{"error": str(ve)}]
         except Exception as e:
+            # The session is shared with the message logging of the request, it must stay usable
+            self.db.rollback()
             print(f"ERROR: Unexpected error during database query: {e}")
             return [{"error": f"An unexpected database error occurred: {e}"}]
 
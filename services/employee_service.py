@@ -1,13 +1,37 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from uuid import UUID
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from uuid import UUID, uuid4
 from typing import List, Optional
 
-from database import models
+from database import models, queries
 from api.schemas import EmployeeCreate, EmployeeUpdate
+from utils.search_utils import LIKE_ESCAPE_CHARACTER, contains_pattern, normalize_search_term
 from database.database import get_db
 from fastapi import Depends, HTTPException
 
+# PostgreSQL error code of a unique constraint violation
+UNIQUE_VIOLATION = "23505"
+
+
+def _creation_error(e: IntegrityError) -> ValueError:
+    """
+    Translates the IntegrityError of an employee INSERT into the ValueError raised to the caller.
+    """
+
+    # Only unique violations (SQLSTATE 23505) mean the employee exists already,
+    # the violated unique index tells which of the two fields is taken
+    if getattr(e.orig, "pgcode", None) != UNIQUE_VIOLATION:
+        return ValueError(f"Database error creating employee: {e.orig}")
+
+    constraint_name = getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+    if constraint_name == "ix_employees_email":
+        return ValueError("Employee with this email already exists.")
+    if constraint_name == "ix_employees_phone_number":
+        return ValueError("Employee with this phone number already exists.")
+    return ValueError("Employee with this phone number or email already exists.")
+
+
 class EmployeeService:
     def __init__(self, db: Session):
         """
@@ -21,111 +45,187 @@ class EmployeeService:
     ) -> models.Employee:
         """
         Creates a new employee in the database.
-        Includes checking for existing phone number or email.
+        Existing phone numbers or emails are detected by the unique indexes
+        of the table, so no extra lookup is needed before the insert.
         """
 
-        # Check whether an employee with the exact e-mail / phone number already exists
-        db_employee = self.db.query(models.Employee).filter(
-            or_(
-                models.Employee.phone_number == employee_data.phone_number,
-                models.Employee.email == employee_data.email
-            )
-        ).first()
-
-        if db_employee:
-            raise ValueError("Employee with this phone number or email already exists.")
-
-        new_employee = models.Employee(
-            name=employee_data.name,
-            username=employee_data.username,
-            hashed_password=employee_data.hashed_password,
-            phone_number=employee_data.phone_number,
-            email=employee_data.email,
-            role=employee_data.role
+        # One INSERT ... RETURNING instead of building, adding and refreshing an ORM instance
+        stmt = (
+            insert(models.Employee)
+            .values(**employee_data.model_dump(exclude_none=True))
+            .returning(models.Employee)
         )
 
-        self.db.add(new_employee)
-        self.db.commit()
-        self.db.refresh(new_employee)
-        return new_employee
+        try:
+            new_employee = self.db.scalars(stmt).one()
+            self.db.commit()
+            return new_employee
+
+        except IntegrityError as e:
+            self.db.rollback()
+            raise _creation_error(e)
+
+    def create_employees(
+        self,
+        employees_data: List[EmployeeCreate]
+    ) -> List[models.Employee]:
+        """
+        Creates several employees with one multi-row INSERT ... RETURNING
+        and a single commit for the whole batch (e.g. for onboarding imports).
+        If one phone number or email exists already, no employee is created.
+        The employees are returned in the order they were passed.
+        """
 
+        if not employees_data:
+            return []
+
+        # The IDs are generated here instead of by the server default: the RETURNING rows of a batched
+        # INSERT come back in any order and are sorted by them. Letting SQLAlchemy keep the order
+        # (sort_by_parameter_order) would send one INSERT per row for a server-generated key
+        rows = [{"id": uuid4(), **employee_data.model_dump()} for employee_data in employees_data]
+
+        try:
+            new_employees = self.db.scalars(insert(models.Employee).returning(models.Employee), rows).all()
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise _creation_error(e)
+
+        employees_by_id = {employee.id: employee for employee in new_employees}
+        return [employees_by_id[row["id"]] for row in rows]
 
     def get_employee_by_id(self, employee_id: UUID) -> Optional[models.Employee]:
         """
         Retrieves an employee by ID.
         """
 
-        return self.db.query(models.Employee).filter(models.Employee.id == employee_id).first()
+        return self.db.get(models.Employee, employee_id)
 
     def get_employee_by_telegram_id(self, telegram_id: int) -> Optional[models.Employee]:
         """
         Retrieves an employee by Telegram ID.
         """
 
-        return self.db.query(models.Employee).filter(models.Employee.telegram_id == telegram_id).first()
+        return self.db.scalars(queries.EMPLOYEE_BY_TELEGRAM_ID, {"telegram_id": telegram_id}).first()
 
     def get_employee_by_phone_number(self, phone_number: str) -> Optional[models.Employee]:
         """
         Retrieves an employee by  phone number.
         """
 
-        return self.db.query(models.Employee).filter(models.Employee.phone_number == phone_number).first()
+        return self.db.scalars(queries.EMPLOYEE_BY_PHONE_NUMBER, {"phone_number": phone_number}).first()
 
     def update_employee_telegram_details(self, employee_id: UUID, telegram_id: Optional[int] = None) -> Optional[models.Employee]:
         """
         Updates specific telegram related details (telegram_id) of an existing employee.
+        The change is written with a single UPDATE ... RETURNING, which only matches if the
+        Telegram ID differs, so no SELECT before and no refresh after the update is needed.
         """
 
-        db_employee = self.db.query(models.Employee).filter(models.Employee.id == employee_id).first()
-        if db_employee:
-            changed = False
-            if telegram_id is not None and db_employee.telegram_id != telegram_id:
-                db_employee.telegram_id = telegram_id
-                changed = True
-
-
-            if changed:
-                try:
-                    self.db.commit()
-                    self.db.refresh(db_employee)
-                    print(f"Employee ({employee_id}) telegram ID has been updated.")
-                    return db_employee
-                except Exception as e:
-                    self.db.rollback()
-                    print(f"ERROR: Error while updating telegram ID for employee {employee_id}: {e}")
-                    raise
-            else:
+        if telegram_id is not None:
+            params = {"link_employee_id": employee_id, "link_telegram_id": telegram_id}
+            try:
+                db_employee = self.db.execute(queries.SET_TELEGRAM_ID_IF_CHANGED, params).scalar_one_or_none()
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                print(f"ERROR: Error while updating telegram ID for employee {employee_id}: {e}")
+                raise
+
+            if db_employee:
+                print(f"Employee ({employee_id}) telegram ID has been updated.")
                 return db_employee
-        return None
+
+        # Nothing changed (or unknown ID): the current state of the employee, from the identity map if already loaded
+        return self.get_employee_by_id(employee_id)
 
     def set_employee_authenticated_status(self, employee_id: UUID, status: bool) -> Optional[models.Employee]:
         """
         Sets authentification status of an employee.
+        The change is written with a single UPDATE ... RETURNING, no SELECT before and no refresh after it.
         """
 
-        db_employee = self.db.query(models.Employee).filter(models.Employee.id == employee_id).first()
+        stmt = (
+            update(models.Employee)
+            .where(models.Employee.id == employee_id)
+            .values(is_authenticated=status)
+            .returning(models.Employee)
+            # An employee already loaded in the session is overwritten with the returned row
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            db_employee = self.db.scalars(stmt).one_or_none()
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"ERROR: Error while setting authentification status for employee {employee_id}: {e}")
+            raise
+
         if db_employee:
-            db_employee.is_authenticated = status
-            try:
-                self.db.commit()
-                self.db.refresh(db_employee)
-                print(f"Employee ({employee_id}) authentification status now set to 'is_authenticated = {status}'.")
-                return db_employee
-            except Exception as e:
-                self.db.rollback()
-                print(f"ERROR: Error while setting authentification status for employee {employee_id}: {e}")
-                raise
-        return None
+            print(f"Employee ({employee_id}) authentification status now set to 'is_authenticated = {status}'.")
+        return db_employee
+
+
+    def authenticate_if_pending(self, employee_id: UUID, email: str) -> Optional[bool]:
+        """
+        Sets 'is_authenticated = True' for the employee with the given ID and email address
+        in a single UPDATE statement, if the employee is not authenticated yet.
+        Email addresses are stored lowercase, so the lowercased token email is compared with '='.
+
+        Returns: True if the employee has just been authenticated,
+                 False if the employee was already authenticated,
+                 None if no employee matches the ID and email address.
+        """
+
+        params = {"token_employee_id": employee_id, "token_email": email.lower()}
+
+        try:
+            authenticated_id = self.db.execute(queries.AUTHENTICATE_IF_PENDING, params).scalar_one_or_none()
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            print(f"ERROR: Error while setting authentification status for employee {employee_id}: {e}")
+            raise
 
+        if authenticated_id:
+            return True
 
-    def get_all_employees(self, name_query: Optional[str] = None) -> List[models.Employee]:
+        # Nothing updated: either already authenticated or no matching employee
+        already_authenticated = self.db.scalar(queries.EMPLOYEE_EXISTS_BY_ID_AND_EMAIL, params)
+
+        return False if already_authenticated else None
+
+    def get_all_employees(
+        self,
+        name_query: Optional[str] = None,
+        after: Optional[UUID] = None,
+        limit: Optional[int] = None
+    ) -> List[models.Employee]:
         """
         Retrieves a list of employees, optionally filtered by name.
+        Newest employees come first. For paging, 'after' is the ID of the last employee
+        of the previous page (keyset pagination, no OFFSET re-scan).
         """
         query = self.db.query(models.Employee)
 
+        name_query = normalize_search_term(name_query)
         if name_query:
-            query = query.filter(models.Employee.name.ilike(f"%{name_query}%"))
+            query = query.filter(models.Employee.name.ilike(contains_pattern(name_query), escape=LIKE_ESCAPE_CHARACTER))
+
+        if after:
+            # (created_at, id) of the cursor employee, resolved inside the same statement
+            cursor = (
+                select(models.Employee.created_at, models.Employee.id)
+                .where(models.Employee.id == after)
+                .scalar_subquery()
+            )
+            query = query.filter(tuple_(models.Employee.created_at, models.Employee.id) < cursor)
+
+        query = query.order_by(models.Employee.created_at.desc(), models.Employee.id.desc())
+
+        if limit:
+            query = query.limit(limit)
 
         employees = query.all()
         return employees
@@ -136,31 +236,40 @@ class EmployeeService:
         employee_update_data: EmployeeUpdate
     ) -> Optional[models.Employee]:
         """
-        Updates an existing employee's fields.
+        Updates an existing employee's fields with a single UPDATE ... RETURNING statement.
         Handles unique constraint violations.
         """
 
-        db_employee = self.get_employee_by_id(employee_id)
-
-        if not db_employee:
-            raise ValueError("Employee not found")
-
         update_data = employee_update_data.model_dump(exclude_unset=True)
 
-        for key, value in update_data.items():
-            setattr(db_employee, key, value)
+        # Nothing to write, the current state of the employee is returned as it is
+        if not update_data:
+            db_employee = self.get_employee_by_id(employee_id)
+            if not db_employee:
+                raise ValueError("Employee not found")
+            return db_employee
+
+        stmt = (
+            update(models.Employee)
+            .where(models.Employee.id == employee_id)
+            .values(**update_data)
+            .returning(models.Employee)
+        )
 
         try:
-            self.db.add(db_employee)
+            db_employee = self.db.execute(stmt).scalar_one_or_none()
             self.db.commit()
-            self.db.refresh(db_employee)
-            return db_employee
 
         except Exception as e:
             self.db.rollback()
             error_detail = str(e.orig) if hasattr(e, 'orig') else str(e)
             raise ValueError(f"Database error updating employee: {error_detail}")
 
+        if not db_employee:
+            raise ValueError("Employee not found")
+
+        return db_employee
+
     def delete_employee(self, employee_id: UUID) -> bool:
         """
         Deletes an employee by ID.
@@ -1,14 +1,19 @@
 from sqlalchemy.orm import Session
 from uuid import UUID
-from sqlalchemy import desc
-from typing import Optional, Any
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from typing import List, Optional, Any
 
-from database import models
+from database import models, queries
 from api.schemas import MessageLogCreate
 from database.database import get_db
 from fastapi import Depends
 
 
+# PostgreSQL error code of a foreign key violation
+FOREIGN_KEY_VIOLATION = "23503"
+
+
 class MessageLogService:
     def __init__(self, db: Session):
         """
@@ -24,33 +29,73 @@ class MessageLogService:
 
         """
         Creates a new message log entry in the database.
+        Raises ValueError if the referenced employee does not exist.
         """
 
-        db_message_log = models.MessageLog(
-            employee_id=message_log_data.employee_id,
-            direction=message_log_data.direction,
-            raw_message_content=message_log_data.raw_message_content,
-            status=message_log_data.status,
-            phone_number=message_log_data.phone_number,
-            system_response_content=message_log_data.system_response_content,
-            ai_interpreted_command=message_log_data.ai_interpreted_command
-        )
+        # One INSERT ... RETURNING, id and timestamp come back without a refresh.
+        # The foreign key checks the employee, no SELECT beforehand
+        try:
+            db_message_log = self.db.scalars(
+                insert(models.MessageLog).values(**message_log_data.model_dump(exclude_none=True)).returning(models.MessageLog)
+            ).one()
+            self.db.commit()
+            return db_message_log
 
-        self.db.add(db_message_log)
-        self.db.commit()
-        self.db.refresh(db_message_log)
-        return db_message_log
+        except IntegrityError as e:
+            self.db.rollback()
+            if getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION:
+                raise ValueError(f"Employee with ID {message_log_data.employee_id} not found.")
+            raise
+
+
+    def create_message_logs(
+        self,
+        message_logs_data: List[MessageLogCreate]
+    ) -> List[models.MessageLog]:
+
+        """
+        Creates several message log entries with one multi-row INSERT ... RETURNING
+        and a single commit for the whole batch.
+        The entries are returned in the order they were passed.
+        Raises ValueError if one of the referenced employees does not exist (nothing is created).
+        """
+
+        if not message_logs_data:
+            return []
+
+        # All referenced employees are checked with one query
+        employee_ids = {message_log_data.employee_id for message_log_data in message_logs_data if message_log_data.employee_id}
+        if employee_ids:
+            existing_employee_ids = set(self.db.scalars(
+                select(models.Employee.id).where(models.Employee.id.in_(employee_ids))
+            ))
+            missing_employee_ids = employee_ids - existing_employee_ids
+            if missing_employee_ids:
+                raise ValueError(f"Employees with IDs {', '.join(sorted(map(str, missing_employee_ids)))} not found.")
+
+        # An employee deleted after the check is still caught by the foreign key
+        try:
+            db_message_logs = self.db.scalars(
+                insert(models.MessageLog).returning(models.MessageLog, sort_by_parameter_order=True),
+                [message_log_data.model_dump() for message_log_data in message_logs_data]
+            ).all()
+            self.db.commit()
+            return list(db_message_logs)
+
+        except IntegrityError as e:
+            self.db.rollback()
+            if getattr(e.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION:
+                raise ValueError("One of the referenced employees was not found.")
+            raise
 
 
     def get_latest_message_log(self) -> Optional[models.MessageLog]:
         """
-        Retrieves the most recently added message log entry.
+        Retrieves the most recently added message log entry,
+        together with its employee in the same query.
         """
-        return (
-            self.db.query(models.MessageLog)
-            .order_by(desc(models.MessageLog.timestamp))
-            .first()
-        )
+
+        return self.db.scalars(queries.LATEST_MESSAGE_LOG).first()
 
 # Dependency for FastAPI-Router
 # Function is used by FastAPI as dependency to inject a service instance
@@ -5,7 +5,7 @@ import json
 
 from database import models
 from database.database import get_db
-from database.models import MessageDirection, MessageStatus
+from database.enums import MessageDirection, MessageStatus
 from api.schemas import MessageLogCreate, MessageLog
 from api.schemas import Employee
 from services.message_log_service import MessageLogService, get_message_log_service
@@ -1,11 +1,12 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import exists, func, insert, or_, select, tuple_
 from uuid import UUID
 from typing import List, Optional
-import datetime
 
 from database import models
 from api.schemas import ProductCreate, ProductUpdate
+from utils.search_utils import LIKE_ESCAPE_CHARACTER, contains_pattern, normalize_search_term
 from database.database import get_db
 from services.employee_service import EmployeeService, get_employee_service
 from fastapi import Depends, HTTPException
@@ -26,7 +27,8 @@ class ProductService:
         Returns True if deleted, False if not found.
         """
 
-        db_product = self.get_product_by_id(product_id)
+        # The product manager isn't needed for the delete, so it isn't joined
+        db_product = self.db.get(models.Product, product_id)
 
         if not db_product:
             raise ValueError("Product not found")
@@ -43,12 +45,12 @@ class ProductService:
         Creates a new product in the database.
         """
 
-        # Check whether an employee with the exact name already exists
-        db_product = self.db.query(models.Product).filter(
-            models.Product.name == product_data.name
-        ).first()
+        # Check whether a product with the exact name already exists (EXISTS, no product row is loaded)
+        name_taken = self.db.scalar(
+            select(exists().where(models.Product.name == product_data.name))
+        )
 
-        if db_product:
+        if name_taken:
             raise ValueError("Product with this exact name already exists.")
 
         product_manager_instance = None
@@ -57,52 +59,69 @@ class ProductService:
             if not product_manager_instance:
                 raise ValueError(f"Product manager with ID '{product_data.product_manager_id}' not found.")
 
-        new_product = models.Product(
-            name=product_data.name,
-            description=product_data.description,
-            product_manager=product_manager_instance,
-            length=product_data.length,
-            height=product_data.height,
-            width=product_data.width,
-            weight=product_data.weight,
-            image_url=product_data.image_url,
-            price=product_data.price,
-            stock_quantity=product_data.stock_quantity,
-            notes=product_data.notes
-        )
+        product_values = product_data.model_dump(exclude_none=True)
 
         # Logic for is_active status based on stock_quantity
-        if new_product.stock_quantity == 0:
-            new_product.is_active = False
-            print(f"Product '{new_product.name}' automatically deactivated: stock_quantity has reached 0")
-        elif new_product.stock_quantity > 0:
-            if not new_product.is_active:
-                new_product.is_active = True
-                print(f"Product '{new_product.name}' automatically activated: stock_quantity > 0")
-
-        self.db.add(new_product)
+        if product_values["stock_quantity"] == 0:
+            product_values["is_active"] = False
+            print(f"Product '{product_data.name}' automatically deactivated: stock_quantity has reached 0")
+        else:
+            if not product_values.get("is_active", True):
+                print(f"Product '{product_data.name}' automatically activated: stock_quantity > 0")
+            product_values["is_active"] = True
+
+        # One INSERT ... RETURNING instead of building, adding and refreshing an ORM instance
+        new_product = self.db.scalars(
+            insert(models.Product).values(**product_values).returning(models.Product)
+        ).one()
         self.db.commit()
-        self.db.refresh(new_product)
+
+        # The product manager loaded above is attached directly, so it is not selected again for the response
+        set_committed_value(new_product, "product_manager", product_manager_instance)
         return new_product
 
 
     def get_product_by_id(self, product_id: UUID) -> Optional[models.Product]:
         """
-        Retrieves a product by ID.
+        Retrieves a product by ID, together with its product manager.
         """
 
-        return self.db.query(models.Product).filter(models.Product.id == product_id).first()
+        return self.db.get(models.Product, product_id, options=[joinedload(models.Product.product_manager)])
 
 
-    def get_all_products(self, name_query: Optional[str] = None) -> List[models.Product]:
+    def get_all_products(
+        self,
+        name_query: Optional[str] = None,
+        after: Optional[UUID] = None,
+        limit: Optional[int] = None
+    ) -> List[models.Product]:
         """
         Retrieves a list of products, optionally filtered by name.
+        Newest products come first. For paging, 'after' is the ID of the last product
+        of the previous page (keyset pagination, no OFFSET re-scan).
         """
 
-        query = self.db.query(models.Product)
+        name_query = normalize_search_term(name_query)
+
+        # The product managers are part of the response, loaded in the same query
+        query = self.db.query(models.Product).options(joinedload(models.Product.product_manager))
 
         if name_query:
-            query = query.filter(models.Product.name.ilike(f"%{name_query}%"))
+            query = query.filter(models.Product.name.ilike(contains_pattern(name_query), escape=LIKE_ESCAPE_CHARACTER))
+
+        if after:
+            # (created_at, id) of the cursor product, resolved inside the same statement
+            cursor = (
+                select(models.Product.created_at, models.Product.id)
+                .where(models.Product.id == after)
+                .scalar_subquery()
+            )
+            query = query.filter(tuple_(models.Product.created_at, models.Product.id) < cursor)
+
+        query = query.order_by(models.Product.created_at.desc(), models.Product.id.desc())
+
+        if limit:
+            query = query.limit(limit)
 
         products = query.all()
         return products
@@ -125,13 +144,16 @@ class ProductService:
 
         # Check only if the name is part of update request
         if product_update_data.name is not None and product_update_data.name != db_product.name:
-            # Exact request for the new name
-            existing_product_with_new_name = self.db.query(models.Product).filter(
-                models.Product.name == product_update_data.name
-            ).first()
-
-            # Check if the new name exists already and its not the product we want to update:
-            if existing_product_with_new_name and existing_product_with_new_name.id != product_id:
+            # Check if the new name exists already and its not the product we want to update
+            # (EXISTS, no product row is loaded):
+            name_taken = self.db.scalar(
+                select(exists().where(
+                    models.Product.name == product_update_data.name,
+                    models.Product.id != product_id
+                ))
+            )
+
+            if name_taken:
                 raise ValueError(f"Product with name '{product_update_data.name}' already exists for another product.")
 
         # Update data
@@ -169,7 +191,8 @@ class ProductService:
                 print(
                     f"Product '{db_product.name}' automatically activated: stock_quantity > 0")
 
-        db_product.updated_at = datetime.datetime.now(datetime.timezone.utc)
+        # set by PostgreSQL, also if none of the values changed
+        db_product.updated_at = func.now()
 
         try:
             self.db.add(db_product)
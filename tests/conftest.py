@@ -11,7 +11,9 @@ load_dotenv(dotenv_path=".env.test")
 # Import Base und get_db
 from database.database import Base, get_db
 
+from fastapi import FastAPI
 from main import app
+from api.routes import employees, message_logs
 # Import of all models that Base.metadata knows all of them when creating it for testing
 from database import models
 
@@ -48,8 +50,9 @@ def db_session_for_test(test_engine):
     connection = test_engine.connect()
     transaction = connection.begin()
 
-    # Binding the session to the specific connection
-    db = Session(bind=connection)
+    # Binding the session to the specific connection,
+    # a rollback inside the app code only rolls back to a savepoint of the test transaction
+    db = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
 
     # Override the dependency of FastAPI app to use the test db session
     app.dependency_overrides[get_db] = lambda: db
@@ -73,4 +76,19 @@ def client(db_session_for_test):
     Provides FastAPI TestClient to send requests to the app.
     """
 
-    return TestClient(app)
\ No newline at end of file
+    return TestClient(app)
+
+
+@pytest.fixture(scope="function")
+def message_log_client(db_session_for_test):
+    """ Fixture for a TestClient of an app serving the employee and message log routes.
+    main.py doesn't include the message log router (no authentication on it yet),
+    so its tests run against this separate app.
+    """
+
+    message_log_app = FastAPI()
+    message_log_app.include_router(employees.employees_router)
+    message_log_app.include_router(message_logs.message_log_router)
+    message_log_app.dependency_overrides[get_db] = lambda: db_session_for_test
+
+    return TestClient(message_log_app)
@@ -0,0 +1,112 @@
+from datetime import timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+import jwt
+import pytest
+import uuid
+
+from api.routes import auth
+from database import models
+from utils.jwt_utils import JWT_ALGORITHM, JWT_SECRET_KEY, create_magic_link_token
+
+
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """ Every test starts without cached magic link tokens. """
+
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+
+def create_test_employee(client: TestClient) -> dict:
+    """ Creates an employee with the POST /employees/ endpoint and returns the response data. """
+
+    employee_data = {
+        "name": "Magic Link User",
+        "phone_number": "+491234567890",
+        "email": "magic.link@example.com",
+        "role": "general_user"
+    }
+
+    response = client.post("/employees/", json=employee_data)
+    assert response.status_code == 201
+
+    return response.json()
+
+
+def test_verify_magic_link_success(client: TestClient, db_session_for_test: Session):
+    """
+    Tests that a valid magic link authenticates the employee and shows the success page,
+    also when the link is opened a second time.
+    """
+
+    employee = create_test_employee(client)
+    token = create_magic_link_token(uuid.UUID(employee["id"]), employee["email"])
+
+    response = client.get("/auth/verify", params={"token": token})
+    assert response.status_code == 200
+    assert "Authentication was successful!" in response.text
+
+    db_employee = db_session_for_test.get(models.Employee, uuid.UUID(employee["id"]))
+    db_session_for_test.refresh(db_employee)
+    assert db_employee.is_authenticated is True
+
+    # Already authenticated employees get the success page again
+    response = client.get("/auth/verify", params={"token": token})
+    assert "Authentication was successful!" in response.text
+
+
+def test_verify_magic_link_expired(client: TestClient, db_session_for_test: Session):
+    """ Tests that an expired magic link shows the failure page and doesn't authenticate the employee. """
+
+    employee = create_test_employee(client)
+    token = create_magic_link_token(uuid.UUID(employee["id"]), employee["email"], expires_delta=timedelta(minutes=-1))
+
+    response = client.get("/auth/verify", params={"token": token})
+    assert response.status_code == 200
+    assert "Authentication was not successful!" in response.text
+
+    db_employee = db_session_for_test.get(models.Employee, uuid.UUID(employee["id"]))
+    db_session_for_test.refresh(db_employee)
+    assert db_employee.is_authenticated is False
+
+
+@pytest.mark.parametrize("token_employee_id, token_email", [
+    (None, "other.user@example.com"),
+    (uuid.uuid4(), "magic.link@example.com"),
+])
+def test_verify_magic_link_mismatch(client: TestClient, db_session_for_test: Session, token_employee_id, token_email):
+    """
+    Tests that a magic link whose employee ID or email address doesn't match an employee
+    shows the failure page and doesn't authenticate the employee.
+    """
+
+    employee = create_test_employee(client)
+    token = create_magic_link_token(token_employee_id or uuid.UUID(employee["id"]), token_email)
+
+    response = client.get("/auth/verify", params={"token": token})
+    assert response.status_code == 200
+    assert "Authentication was not successful!" in response.text
+
+    db_employee = db_session_for_test.get(models.Employee, uuid.UUID(employee["id"]))
+    db_session_for_test.refresh(db_employee)
+    assert db_employee.is_authenticated is False
+
+
+def test_verify_magic_link_without_expiry(client: TestClient, db_session_for_test: Session):
+    """ Tests that a signed token without 'exp' shows the failure page, also when the link is opened again. """
+
+    employee = create_test_employee(client)
+    token = jwt.encode(
+        {"employee_id": employee["id"], "email": employee["email"]}, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM
+    )
+
+    for _ in range(2):
+        response = client.get("/auth/verify", params={"token": token})
+        assert response.status_code == 200
+        assert "Authentication was not successful!" in response.text
+
+    db_employee = db_session_for_test.get(models.Employee, uuid.UUID(employee["id"]))
+    db_session_for_test.refresh(db_employee)
+    assert db_employee.is_authenticated is False
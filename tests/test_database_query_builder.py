@@ -0,0 +1,105 @@
+from sqlalchemy.orm import Session
+import pytest
+
+from database import models
+from database.enums import UserRole
+from services.database_query_builder_service import DatabaseQueryBuilder, _build_statement
+
+
+@pytest.fixture
+def query_builder(db_session_for_test: Session) -> DatabaseQueryBuilder:
+    """ Fixture for a DatabaseQueryBuilder on the test db session with one employee and three products. """
+
+    employee = models.Employee(name="Ann Lee", phone_number="+4912345", email="ann@example.com", role=UserRole.admin)
+    db_session_for_test.add(employee)
+    db_session_for_test.flush()
+
+    db_session_for_test.add_all([
+        models.Product(name="Red_Chair", price=12.5, stock_quantity=1, is_active=False, product_manager_id=employee.id),
+        models.Product(name="RedXChair", price=20, stock_quantity=2, is_active=True, notes="Internal note"),
+        models.Product(name="Table 100%", price=99, stock_quantity=3, is_active=True, product_manager_id=employee.id),
+    ])
+    db_session_for_test.flush()
+
+    return DatabaseQueryBuilder(db_session_for_test)
+
+
+def product_names(query_builder: DatabaseQueryBuilder, filters: dict) -> list:
+    """ Returns the sorted names of the products matching the filters. """
+
+    results = query_builder.execute_query(
+        {"action": "get_data", "table": "products", "columns": ["name"], "filters": filters}
+    )
+    return sorted(result["name"] for result in results)
+
+
+def test_query_builder_reuses_built_statements(query_builder: DatabaseQueryBuilder):
+    """
+    Tests that intents of the same shape reuse the cached statement, with their own filter values and limits.
+    """
+
+    _build_statement.cache_clear()
+
+    assert product_names(query_builder, {"name": "chair"}) == ["RedXChair", "Red_Chair"]
+    assert product_names(query_builder, {"name": "table"}) == ["Table 100%"]
+
+    cache_info = _build_statement.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 1)
+
+    results = query_builder.execute_query({"action": "get_data", "table": "products", "columns": ["name"], "limit": 2})
+    assert len(results) == 2
+    results = query_builder.execute_query({"action": "get_data", "table": "products", "columns": ["name"], "limit": "1"})
+    assert len(results) == 1
+    assert _build_statement.cache_info().misses == 2
+
+
+@pytest.mark.parametrize("name_filter, expected_names", [
+    ("d_c", ["Red_Chair"]),
+    ("100%", ["Table 100%"]),
+    ("%", ["Table 100%"]),
+])
+def test_query_builder_matches_wildcards_literally(query_builder: DatabaseQueryBuilder, name_filter, expected_names):
+    """ Tests that '_' and '%' in a text filter match themselves, not any character. """
+
+    assert product_names(query_builder, {"name": name_filter}) == expected_names
+
+
+def test_query_builder_none_filter_is_null(query_builder: DatabaseQueryBuilder):
+    """ Tests that None as filter value selects the rows where the column IS NULL, on any column type. """
+
+    assert product_names(query_builder, {"product_manager_id": None}) == ["RedXChair"]
+    assert product_names(query_builder, {"notes": None}) == ["Red_Chair", "Table 100%"]
+
+
+def test_query_builder_filters_by_column_type(query_builder: DatabaseQueryBuilder):
+    """
+    Tests that the filter follows the column type: Boolean columns accept "true"/"false"/"1"/"0",
+    Enum columns are compared with equality, other columns with equality as well.
+    """
+
+    assert product_names(query_builder, {"is_active": "false"}) == ["Red_Chair"]
+    assert product_names(query_builder, {"is_active": "1"}) == ["RedXChair", "Table 100%"]
+    assert product_names(query_builder, {"is_active": True}) == ["RedXChair", "Table 100%"]
+    assert "error" in query_builder.execute_query(
+        {"action": "get_data", "table": "products", "filters": {"is_active": "maybe"}}
+    )[0]
+
+    assert product_names(query_builder, {"stock_quantity": 2}) == ["RedXChair"]
+
+    def employee_names(role):
+        return query_builder.execute_query(
+            {"action": "get_data", "table": "employees", "columns": ["name"], "filters": {"role": role}}
+        )
+
+    assert employee_names("Admin") == [{"name": "Ann Lee"}]
+    assert employee_names("general_user") == []
+    # Part of an enum value is not a substring match (no ILIKE on Enum columns) but an invalid filter value
+    assert "error" in employee_names("adm")[0]
+
+    # Filters on a column of the joined table use its type as well
+    results = query_builder.execute_query({
+        "action": "get_data", "table": "products", "columns": ["name"],
+        "join_table": "employees", "join_on": "product_manager_id", "join_columns": ["email"],
+        "filters": {"role": "admin"}
+    })
+    assert sorted(result["name"] for result in results) == ["Red_Chair", "Table 100%"]
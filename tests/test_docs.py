@@ -0,0 +1,84 @@
+from fastapi.testclient import TestClient
+import pytest
+
+from api.routes import docs
+
+
+@pytest.fixture(autouse=True)
+def reset_failed_logins():
+    """ Every test starts without failed login attempts. """
+
+    docs._failed_logins.clear()
+    yield
+    docs._failed_logins.clear()
+
+
+VALID_AUTH = (docs.DOCS_USERNAME, docs.DOCS_PASSWORD)
+WRONG_AUTH = (docs.DOCS_USERNAME, "wrong password")
+
+
+def test_docs_valid_and_wrong_credentials(client: TestClient):
+    """
+    Tests that the docs are served with valid credentials and rejected with 401 with wrong ones.
+    """
+
+    assert client.get("/docs", auth=VALID_AUTH).status_code == 200
+
+    response = client.get("/docs", auth=WRONG_AUTH)
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Basic"
+
+
+def test_docs_too_many_failed_logins(client: TestClient, monkeypatch):
+    """
+    Tests that a client gets 429 after too many wrong attempts, while valid credentials
+    are still accepted and other clients (Fly-Client-IP behind the Fly proxy) are not affected.
+    """
+
+    monkeypatch.setattr(docs, "BEHIND_FLY_PROXY", True)
+
+    for _ in range(docs.DOCS_MAX_FAILED_LOGINS):
+        assert client.get("/docs", auth=WRONG_AUTH).status_code == 401
+
+    response = client.get("/docs", auth=WRONG_AUTH)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(docs.DOCS_LOGIN_WINDOW_SECONDS)
+
+    # The correct credentials still pass while the client is limited
+    assert client.get("/docs", auth=VALID_AUTH).status_code == 200
+
+    # Another client behind the Fly proxy has its own counter
+    assert client.get("/docs", auth=WRONG_AUTH, headers={"Fly-Client-IP": "203.0.113.7"}).status_code == 401
+
+
+def test_docs_failed_logins_spoofed_fly_client_ip(client: TestClient, monkeypatch):
+    """
+    Tests that outside the Fly proxy a client can't reset its counter by sending changing Fly-Client-IP headers.
+    """
+
+    monkeypatch.setattr(docs, "BEHIND_FLY_PROXY", False)
+
+    for i in range(docs.DOCS_MAX_FAILED_LOGINS):
+        client.get("/docs", auth=WRONG_AUTH, headers={"Fly-Client-IP": f"203.0.113.{i}"})
+
+    response = client.get("/docs", auth=WRONG_AUTH, headers={"Fly-Client-IP": "198.51.100.1"})
+    assert response.status_code == 429
+
+
+def test_docs_failed_logins_fixed_window(client: TestClient, monkeypatch):
+    """
+    Tests that failed attempts are counted in fixed windows: further failures don't extend the
+    window, once it is over the client gets 401 again.
+    """
+
+    now = [1000.0]
+    monkeypatch.setattr(docs.time, "monotonic", lambda: now[0])
+
+    for _ in range(docs.DOCS_MAX_FAILED_LOGINS):
+        client.get("/docs", auth=WRONG_AUTH)
+
+    now[0] += docs.DOCS_LOGIN_WINDOW_SECONDS - 1
+    assert client.get("/docs", auth=WRONG_AUTH).status_code == 429
+
+    now[0] += 1
+    assert client.get("/docs", auth=WRONG_AUTH).status_code == 401
@@ -97,6 +97,37 @@ def test_create_employee_duplicate_email_or_phone(client: TestClient, db_session
     assert "already exists" in response_3.json()["detail"]
 
 
+def test_create_employees_batch(client: TestClient, db_session_for_test: Session):
+    """
+    Tests that several employees are created with one request, returned in the order of the request,
+    and that a batch containing an existing email address creates none of its employees.
+    """
+
+    employees_data = [
+        {"name": "Batch User 1", "phone_number": "+493333333331", "email": "batch.user1@example.com", "role": "admin"},
+        {"name": "Batch User 2", "phone_number": "+493333333332", "email": "batch.user2@example.com", "role": "general_user"},
+    ]
+
+    response = client.post("/employees/batch", json=employees_data)
+
+    assert response.status_code == 201, f"Expected status 201, got {response.status_code}. Response: {response.json()}"
+    created_employees = response.json()
+    assert [employee["email"] for employee in created_employees] == ["batch.user1@example.com", "batch.user2@example.com"]
+    assert all("id" in employee and "created_at" in employee for employee in created_employees)
+
+    # Second batch: one new employee and one with an email of the first batch, should fail as a whole
+    duplicate_batch = [
+        {"name": "Batch User 3", "phone_number": "+493333333333", "email": "batch.user3@example.com", "role": "general_user"},
+        {"name": "Batch User 4", "phone_number": "+493333333334", "email": "batch.user1@example.com", "role": "general_user"},
+    ]
+
+    response_duplicate = client.post("/employees/batch", json=duplicate_batch)
+
+    assert response_duplicate.status_code == 400, f"Expected status 400, got {response_duplicate.status_code}. Response: {response_duplicate.json()}"
+    assert "already exists" in response_duplicate.json()["detail"]
+    assert len(client.get("/employees/").json()) == 2
+
+
 def test_create_employee_invalid_data(client: TestClient):
     """
     Tests that try creating a new employee with missing data where it is required
@@ -118,6 +149,62 @@ def test_create_employee_invalid_data(client: TestClient):
     assert any("phone_number" in error["loc"] for error in response.json()["detail"])
 
 
+def test_create_employee_phone_number_with_trailing_newline(client: TestClient):
+    """
+    Tests that a phone number followed by a newline is rejected instead of being stored with it.
+    """
+
+    employee_data = {
+        "name": "Newline Phone User",
+        "phone_number": "+4917641208453\n",
+        "email": "newline.phone@example.com",
+        "role": "general_user"
+    }
+
+    response = client.post("/employees/", json=employee_data)
+
+    assert response.status_code == 422, f"Expected status 422, got {response.status_code}. Response: {response.json()}"
+    assert any("phone_number" in error["loc"] for error in response.json()["detail"])
+
+
+@pytest.mark.parametrize("email", ["a@-b.com", "a@b..com", '"quoted"@x.com', "a@b", "no-at-sign.com"])
+def test_create_employee_invalid_email(client: TestClient, email: str):
+    """
+    Tests that malformed e-mail addresses are rejected with 422.
+    """
+
+    employee_data = {
+        "name": "Invalid Email User",
+        "phone_number": "+495555555551",
+        "email": email,
+        "role": "general_user"
+    }
+
+    response = client.post("/employees/", json=employee_data)
+
+    assert response.status_code == 422, f"Expected status 422 for {email!r}, got {response.status_code}. Response: {response.json()}"
+    assert any("email" in error["loc"] for error in response.json()["detail"])
+
+
+def test_create_employee_email_is_normalized(client: TestClient):
+    """
+    Tests that surrounding whitespace (incl. a trailing newline) is stripped from the e-mail address
+    and that it is stored lowercase.
+    """
+
+    employee_data = {
+        "name": "Normalized Email User",
+        "phone_number": "+495555555552",
+        "email": " Normalized.User@Example.COM\n",
+        "role": "general_user"
+    }
+
+    response = client.post("/employees/", json=employee_data)
+
+    assert response.status_code == 201, f"Expected status 201, got {response.status_code}. Response: {response.json()}"
+    assert response.json()["email"] == "normalized.user@example.com"
+
+
 def test_get_employees_empty_db(client: TestClient):
     """
     Test that retrieving employees from an empty database returns an empty list.
@@ -284,6 +371,52 @@ def test_search_employee_partial_and_case_insensitive(client: TestClient):
     assert returned_names == expected_names
 
 
+@pytest.mark.parametrize("params, expected_pages", [
+    ({}, [2, 2, 1, 0]),
+    ({"name_query": "paged"}, [2, 2, 0]),
+])
+def test_get_employees_keyset_pages(client: TestClient, params: dict, expected_pages: list):
+    """
+    Test that paging with 'after' and 'limit' returns every employee exactly once
+    and an empty list past the last page, also together with a name query.
+    """
+
+    expected_ids = set()
+    for i in range(5):
+        # Employees 0-3 match the name query, employee 4 doesn't
+        name = f"Paged User {i}" if i < 4 else "Other User"
+        response = client.post("/employees/", json={
+            "name": name,
+            "phone_number": f"+49444444444{i}",
+            "email": f"paged.user{i}@example.com",
+            "role": "general_user"
+        })
+        assert response.status_code == 201
+        if i < 4 or not params:
+            expected_ids.add(response.json()["id"])
+
+    seen_ids = []
+    pages = []
+    after = None
+    while not pages or pages[-1]:
+        page_params = dict(params, limit=2)
+        if after:
+            page_params["after"] = after
+
+        response = client.get("/employees/", params=page_params)
+        assert response.status_code == 200, f"Expected status 200, got {response.status_code}. Response: {response.json()}"
+
+        page = response.json()
+        pages.append(len(page))
+        seen_ids.extend(employee["id"] for employee in page)
+        if page:
+            after = page[-1]["id"]
+
+    assert pages == expected_pages
+    assert len(seen_ids) == len(set(seen_ids))
+    assert set(seen_ids) == expected_ids
+
+
 def test_update_employee_success(client: TestClient, db_session_for_test: Session):
     """
     Test that an employee can be successfully updated with partial data.
@@ -465,7 +598,7 @@ def test_update_employee_no_data_provided(client: TestClient, db_session_for_tes
     response = client.patch(f"/employees/{employee_id}", json=empty_update_data)
     assert response.status_code == 422
 
-    # Check that a more specific error note is thrown by the pydantic @model_validator
+    # Check that a more specific error note is thrown by the pydantic model_post_init check
     assert "At least one field (name, phone_number, email, role) must be provided for update." in response.json()["detail"][0]["msg"]
 
 
@@ -512,3 +645,30 @@ def test_delete_employee_not_found(client: TestClient, db_session_for_test: Sess
 
     assert response.status_code == 404
     assert response.json() == {"detail": "Employee not found"}
+
+
+def test_set_employee_authenticated_status(client: TestClient, db_session_for_test: Session):
+    """
+    Test that the authentication status is set with the returned employee reflecting it,
+    and that an unknown employee ID returns None.
+    """
+
+    from database import models
+    from services.employee_service import EmployeeService
+
+    response = client.post("/employees/", json={
+        "name": "Status User",
+        "phone_number": "+495555555555",
+        "email": "status.user@example.com",
+        "role": "general_user"
+    })
+    assert response.status_code == 201
+    employee_id = uuid.UUID(response.json()["id"])
+
+    employee_service = EmployeeService(db_session_for_test)
+    db_employee = employee_service.set_employee_authenticated_status(employee_id, True)
+
+    assert db_employee is db_session_for_test.get(models.Employee, employee_id)
+    assert db_employee.is_authenticated is True
+
+    assert employee_service.set_employee_authenticated_status(uuid.UUID(int=0), True) is None
@@ -4,7 +4,7 @@ import pytest
 import uuid
 
 
-def test_create_message_log_success(client: TestClient, db_session_for_test: Session):
+def test_create_message_log_success(message_log_client: TestClient, db_session_for_test: Session):
     """
     Test that the message log is created accordingly and based on an existing employee.
     """
@@ -17,7 +17,7 @@ def test_create_message_log_success(client: TestClient, db_session_for_test: Ses
     }
 
     # Create test employee 1 to have a valid uuid
-    response_employee = client.post("/employees/", json=test_employee_1)
+    response_employee = message_log_client.post("/employees/", json=test_employee_1)
     assert response_employee.status_code == 201
     response_employee_data = response_employee.json()
 
@@ -31,7 +31,7 @@ def test_create_message_log_success(client: TestClient, db_session_for_test: Ses
     }
 
     # Sends post request to endpoint
-    response_1 = client.post("/message_log/", json=test_data_1)
+    response_1 = message_log_client.post("/message_log/", json=test_data_1)
 
     # Check HTTP status code
     assert response_1.status_code == 201, f"Expected status 201, got {response_1.status_code}. Response: {response_1.json()}"
@@ -71,11 +71,11 @@ def test_create_message_log_success(client: TestClient, db_session_for_test: Ses
         "status" : ""
     }
 
-    response_2 = client.post("/message_log/", json=test_data_2)
+    response_2 = message_log_client.post("/message_log/", json=test_data_2)
 
     assert response_2.status_code == 422, f"Expected status 201, got {response_2.status_code}. Response: {response_2.json()}"
 
-def test_get_latest_message_log(client: TestClient, db_session_for_test: Session):
+def test_get_latest_message_log(message_log_client: TestClient, db_session_for_test: Session):
     """
     Test that really the message which was added as last is returned.
     """
@@ -87,7 +87,7 @@ def test_get_latest_message_log(client: TestClient, db_session_for_test: Session
         "role": "general_user"
     }
 
-    response_employee_1 = client.post("/employees/", json=test_employee_1)
+    response_employee_1 = message_log_client.post("/employees/", json=test_employee_1)
 
     assert response_employee_1.status_code == 201
 
@@ -118,9 +118,9 @@ def test_get_latest_message_log(client: TestClient, db_session_for_test: Session
         "phone_number": test_employee_1["phone_number"]
     }
 
-    response_test_data_1 = client.post("/message_log/", json=test_data_1)
-    response_test_data_2 = client.post("/message_log/", json=test_data_2)
-    response_test_data_3 = client.post("/message_log/", json=test_data_3)
+    response_test_data_1 = message_log_client.post("/message_log/", json=test_data_1)
+    response_test_data_2 = message_log_client.post("/message_log/", json=test_data_2)
+    response_test_data_3 = message_log_client.post("/message_log/", json=test_data_3)
 
     response_test_data_1_data = response_test_data_1.json()
     response_test_data_2_data = response_test_data_2.json()
@@ -130,7 +130,7 @@ def test_get_latest_message_log(client: TestClient, db_session_for_test: Session
     assert response_test_data_3.status_code == 201
 
     # get request to fetch the last added message as expected
-    response = client.get("/message_log/last")
+    response = message_log_client.get("/message_log/last")
     assert response.status_code == 200
 
     last_logged_message = response.json()
@@ -152,3 +152,56 @@ def test_get_latest_message_log(client: TestClient, db_session_for_test: Session
 
 
 
+
+
+def test_create_message_logs_batch(message_log_client: TestClient, db_session_for_test: Session):
+    """
+    Test that a batch of message logs is created in the order of the request,
+    and that nothing is created if one of the referenced employees does not exist.
+    """
+
+    test_employee_1 = {
+        "name": "Test User 1",
+        "phone_number": "+491111111111",
+        "email": "test_1@example.com",
+        "role": "general_user"
+    }
+
+    response_employee = message_log_client.post("/employees/", json=test_employee_1)
+    assert response_employee.status_code == 201
+    employee_id = response_employee.json()["id"]
+
+    test_data = [
+        {
+            "employee_id": employee_id,
+            "direction": "inbound",
+            "raw_message_content": f"Batch message Nr. {i}",
+            "status": "received",
+            "phone_number": test_employee_1["phone_number"]
+        }
+        for i in range(3)
+    ]
+
+    response = message_log_client.post("/message_log/batch", json=test_data)
+    assert response.status_code == 201, f"Expected status 201, got {response.status_code}. Response: {response.json()}"
+
+    response_data = response.json()
+    assert [message_log["raw_message_content"] for message_log in response_data] == [
+        "Batch message Nr. 0", "Batch message Nr. 1", "Batch message Nr. 2"
+    ]
+    assert all(message_log["employee_id"] == employee_id for message_log in response_data)
+
+    # Unknown employee: 404 and none of the logs of the batch is created
+    unknown_employee_id = str(uuid.uuid4())
+    test_data_unknown = test_data + [dict(test_data[0], employee_id=unknown_employee_id)]
+
+    response_unknown = message_log_client.post("/message_log/batch", json=test_data_unknown)
+    assert response_unknown.status_code == 404
+    assert unknown_employee_id in response_unknown.json()["detail"]
+
+    from database import models
+
+    assert db_session_for_test.query(models.MessageLog).count() == 3
+
+    # Empty batches are rejected
+    assert message_log_client.post("/message_log/batch", json=[]).status_code == 422
@@ -0,0 +1,61 @@
+from decimal import Decimal
+from sqlalchemy.orm import Session, configure_mappers
+
+from api import schemas
+from database.database import Base
+from database import models
+from database.enums import MessageDirection, MessageStatus, UserRole
+
+
+def test_metadata_contains_exactly_the_app_tables():
+    """
+    Tests that Base.metadata only knows the tables of database/models.py,
+    so create_all/drop_all and the mapper configuration don't pick up stale or duplicate models.
+    """
+
+    assert set(Base.metadata.tables) == {"employees", "products", "message_logs"}
+
+
+def test_mappers_configure_without_errors():
+    """
+    Tests that all ORM relationships between the models resolve.
+    """
+
+    configure_mappers()
+
+    assert models.Product.product_manager.property.mapper.class_ is models.Employee
+    assert models.MessageLog.employee.property.mapper.class_ is models.Employee
+
+
+def test_as_dict_matches_the_response_schemas(db_session_for_test: Session):
+    """
+    Tests that the routes serializing with as_dict() return exactly what the response schemas
+    (response_model) would, for Employee, Product (with and without product manager) and MessageLog.
+    """
+
+    employee = models.Employee(name="Ann Lee", phone_number="+491234567890", email="ann@example.com", role=UserRole.admin)
+    db_session_for_test.add(employee)
+    db_session_for_test.flush()
+
+    product = models.Product(name="Chair", price=Decimal("12.50"), length=Decimal("1.2"), stock_quantity=3,
+                             is_active=True, product_manager_id=employee.id)
+    product_without_manager = models.Product(name="Table", price=Decimal("99"), stock_quantity=0)
+    message_log = models.MessageLog(employee_id=employee.id, phone_number="+491234567890", direction=MessageDirection.inbound,
+                                    raw_message_content="Hello", status=MessageStatus.received)
+    db_session_for_test.add_all([product, product_without_manager, message_log])
+    db_session_for_test.flush()
+
+    # Server side defaults (ids, timestamps) are loaded from the database,
+    # the product manager is loaded explicitly like the product queries of the services do
+    for db_object in (employee, message_log):
+        db_session_for_test.refresh(db_object)
+    for db_object in (product, product_without_manager):
+        db_session_for_test.refresh(db_object)
+        db_session_for_test.refresh(db_object, ["product_manager"])
+
+    # from_attributes on the call, like FastAPI validates a response_model (also for the nested product manager)
+    assert employee.as_dict() == schemas.Employee.model_validate(employee, from_attributes=True).model_dump(mode="json")
+    assert employee.as_dict(base_only=True) == schemas.EmployeeBase.model_validate(employee, from_attributes=True).model_dump(mode="json")
+    for db_product in (product, product_without_manager):
+        assert db_product.as_dict() == schemas.Product.model_validate(db_product, from_attributes=True).model_dump(mode="json")
+    assert message_log.as_dict() == schemas.MessageLog.model_validate(message_log, from_attributes=True).model_dump(mode="json")
@@ -126,12 +126,12 @@ def test_create_product_invalid_data(client: TestClient):
 
 def test_get_all_products_empty_db(client: TestClient):
     """
-    Tests that retrieving all products from an empty database returns 404 (as per your endpoint's logic).
+    Tests that retrieving all products from an empty database returns an empty list.
     """
 
     response = client.get("/products/all")
-    assert response.status_code == 404, f"Expected status 404, got {response.status_code}. Response: {response.json()}"
-    assert response.json()["detail"] == "No products found"
+    assert response.status_code == 200, f"Expected status 200, got {response.status_code}. Response: {response.json()}"
+    assert response.json() == []
 
 
 def test_get_all_products_multiple_exist(client: TestClient):
@@ -336,7 +336,7 @@ def test_get_product_by_name_success(client: TestClient):
 
 def test_get_product_by_name_not_found(client: TestClient):
     """
-    Tests retrieving products by a non-existent name returns 404.
+    Tests retrieving products by a non-existent name returns an empty list.
     """
     product_data_1 = {
         "name": "Test Product A",
@@ -355,11 +355,11 @@ def test_get_product_by_name_not_found(client: TestClient):
     # creating one product but not the one searched for
     client.post("/products/", json=product_data_1)
 
-    # searching for NonExistentProduct, expecting 404 Not found Error
+    # searching for NonExistentProduct, expecting an empty list
     response = client.get("/products/search", params={"name_query": "NonExistentProduct"})
 
-    assert response.status_code == 404, f"Expected status 404, got {response.status_code}. Response: {response.json()}"
-    assert response.json()["detail"] == "No products found with this name"
+    assert response.status_code == 200, f"Expected status 200, got {response.status_code}. Response: {response.json()}"
+    assert response.json() == []
 
 
 def test_update_product_success(client: TestClient):
@@ -505,7 +505,7 @@ def test_update_product_duplicate_name(client: TestClient):
 def test_update_product_no_data_provided(client: TestClient):
     """
     Tests that attempting to update a product by sending an empty JSON body
-    returns 422 due to the @model_validator in ProductUpdate.
+    returns 422 due to the model_post_init check in ProductUpdate.
     """
 
     product_data_1 = {
@@ -533,7 +533,7 @@ def test_update_product_no_data_provided(client: TestClient):
 
     assert response.status_code == 422, f"Expected status 422, got {response.status_code}. Response: {response.json()}"
 
-    # This specific error message comes from your @model_validator in ProductUpdate
+    # This specific error message comes from the model_post_init check in ProductUpdate
     assert "At least one field (name, description, size, price etc.) must be provided for update." in response.json()["detail"][0]["msg"]
 
 
@@ -587,3 +587,120 @@ def test_delete_product_not_found(client: TestClient):
     response = client.delete(f"/products/{non_existent_id}")
     assert response.status_code == 404, f"Expected status 404, got {response.status_code}. Response: {response.json()}"
     assert response.json()["detail"] == "Product not found"
+
+
+def test_get_product_by_id_shows_current_product_manager(client: TestClient):
+    """
+    Tests that a product read after its product manager was renamed returns the new name
+    (single products are not cached).
+    """
+
+    manager_data = {
+        "name": "Manager Before",
+        "phone_number": "+494444444441",
+        "email": "manager.rename@example.com",
+        "role": "admin"
+    }
+    manager_id = client.post("/employees/", json=manager_data).json()["id"]
+
+    product_data = {"name": "Managed Product", "price": 9.99, "stock_quantity": 5, "product_manager_id": manager_id}
+    product_id = client.post("/products/", json=product_data).json()["id"]
+
+    assert client.get(f"/products/{product_id}").json()["product_manager"]["name"] == "Manager Before"
+
+    response_update = client.patch(f"/employees/{manager_id}", json={"name": "Manager After"})
+    assert response_update.status_code == 200
+
+    response = client.get(f"/products/{product_id}")
+    assert response.status_code == 200
+    assert response.json()["product_manager"]["name"] == "Manager After"
+
+
+
+
+def test_update_and_delete_product_with_product_manager(client: TestClient, db_session_for_test: Session):
+    """
+    Tests that updating a product returns its current product manager (changed, kept or removed),
+    and that a product with product manager can be deleted.
+    """
+
+    manager_ids = []
+    for i in range(2):
+        response = client.post("/employees/", json={
+            "name": f"Manager {i}",
+            "phone_number": f"+49666666666{i}",
+            "email": f"manager{i}@example.com",
+            "role": "admin"
+        })
+        manager_ids.append(response.json()["id"])
+
+    product_data = {"name": "Managed Product", "price": 9.99, "stock_quantity": 5, "product_manager_id": manager_ids[0]}
+    product_id = client.post("/products/", json=product_data).json()["id"]
+
+    # Products are read with a fresh session state, like in a new request
+    db_session_for_test.expunge_all()
+
+    response = client.patch(f"/products/{product_id}", json={"name": "Renamed Product"})
+    assert response.status_code == 200
+    assert response.json()["product_manager"]["name"] == "Manager 0"
+
+    db_session_for_test.expunge_all()
+    response = client.patch(f"/products/{product_id}", json={"product_manager_id": manager_ids[1]})
+    assert response.status_code == 200
+    assert response.json()["product_manager_id"] == manager_ids[1]
+    assert response.json()["product_manager"]["name"] == "Manager 1"
+
+    db_session_for_test.expunge_all()
+    response = client.patch(f"/products/{product_id}", json={"product_manager_id": None})
+    assert response.status_code == 200
+    assert response.json()["product_manager_id"] is None
+    assert response.json()["product_manager"] is None
+
+    db_session_for_test.expunge_all()
+    client.patch(f"/products/{product_id}", json={"product_manager_id": manager_ids[0]})
+    db_session_for_test.expunge_all()
+    assert client.delete(f"/products/{product_id}").status_code == 204
+    assert client.get(f"/products/{product_id}").status_code == 404
+
+
+@pytest.mark.parametrize("path, params, expected_pages", [
+    ("/products/all", {}, [2, 2, 2, 0]),
+    ("/products/search", {"name_query": "paged"}, [2, 2, 1, 0]),
+])
+def test_get_products_keyset_pages(client: TestClient, path: str, params: dict, expected_pages: list):
+    """
+    Tests that paging with 'after' and 'limit' returns every product exactly once
+    and an empty list past the last page.
+    """
+
+    expected_ids = set()
+    for i in range(5):
+        response = client.post("/products/", json={"name": f"Paged Product {i}", "price": 1.0 + i, "stock_quantity": i})
+        assert response.status_code == 201
+        expected_ids.add(response.json()["id"])
+
+    # A product only the full list returns, not the search
+    response = client.post("/products/", json={"name": "Other Item", "price": 1.0, "stock_quantity": 1})
+    if path == "/products/all":
+        expected_ids.add(response.json()["id"])
+
+    seen_ids = []
+    pages = []
+    after = None
+    while not pages or pages[-1]:
+        page_params = dict(params, limit=2)
+        if after:
+            page_params["after"] = after
+
+        response = client.get(path, params=page_params)
+        assert response.status_code == 200, f"Expected status 200, got {response.status_code}. Response: {response.json()}"
+
+        page = response.json()
+        pages.append(len(page))
+        seen_ids.extend(product["id"] for product in page)
+        if page:
+            after = page[-1]["id"]
+
+    assert pages == expected_pages
+    assert len(seen_ids) == len(set(seen_ids))
+    assert set(seen_ids) == expected_ids
@@ -55,6 +55,27 @@ def create_magic_link_token(employee_id: UUID, email: str, expires_delta: Option
     return encoded_jwt
 
 
+def get_employee_id_from_token(decoded_token: Dict[str, Any]) -> UUID:
+    """
+    Extracts the employee ID from a decoded magic link token.
+
+    Args:
+        decoded_token (Dict[str, Any]): The decoded payload of the magic link token.
+
+    Returns:
+        UUID: The employee ID.
+
+    Raises:
+        ValueError: If the token does not contain a valid employee ID.
+    """
+
+    employee_id = decoded_token.get("employee_id")
+    if employee_id is None:
+        raise ValueError("Token does not contain an employee ID.")
+
+    return UUID(employee_id)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Generates a JWT for general access.
@@ -0,0 +1,55 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Union
+
+# Format of every log line
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Background listener writing the queued log records, set by setup_logging()
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: Union[int, str] = logging.INFO) -> QueueListener:
+    """
+    Configures the root logger to only enqueue log records.
+    A QueueListener thread takes them from the queue and writes them to stderr,
+    so request handlers never block on the output stream.
+
+    Args:
+        level (int | str): The log level of the root logger, as number or name like 'DEBUG' (default: INFO).
+
+    Returns:
+        _listener (QueueListener): The started listener (already running if setup_logging was called before).
+    """
+
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """
+    Stops the QueueListener and writes all records that are still queued.
+    """
+
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,43 @@
+from typing import Optional
+
+# Escape character used in LIKE patterns built by contains_pattern()
+LIKE_ESCAPE_CHARACTER = "\\"
+
+
+def contains_pattern(search_term: str) -> str:
+    """
+    Builds a '%...%' LIKE pattern that matches the search term literally.
+    '%', '_' and the escape character typed by the user are escaped, so they don't act as wildcards
+    (a bare '%' or '_' would otherwise match every row and bypass the trigram indexes).
+
+    Args:
+        search_term (str): The normalized search term (see normalize_search_term).
+
+    Returns:
+        str: The LIKE pattern, to be used with escape=LIKE_ESCAPE_CHARACTER.
+    """
+
+    escaped = (
+        search_term
+        .replace(LIKE_ESCAPE_CHARACTER, LIKE_ESCAPE_CHARACTER * 2)
+        .replace("%", LIKE_ESCAPE_CHARACTER + "%")
+        .replace("_", LIKE_ESCAPE_CHARACTER + "_")
+    )
+    return f"%{escaped}%"
+
+
+def normalize_search_term(search_term: Optional[str]) -> Optional[str]:
+    """
+    Normalizes a search term once, before it is used in a query: surrounding whitespace is removed.
+    Returns None for empty terms, which means no filtering.
+
+    Args:
+        search_term (Optional[str]): The search term as sent by the client.
+
+    Returns:
+        Optional[str]: The normalized search term or None.
+    """
+
+    if search_term is None:
+        return None
+    return search_term.strip() or None